@@ -107,13 +107,15 @@ class CategoryService:
             is not None
         )
 
-    def add_category(self, category: str, transaction_type_input: str) -> Category:
+    def add_category(
+        self, category: str, transaction_type_input: str | TransactionType
+    ) -> Category:
         """
         Add a new category.
 
         Args:
             category (str): Category name.
-            transaction_type_input (str): Transaction type.
+            transaction_type_input (str | TransactionType): Transaction type.
 
         Returns:
             Category: Newly created category.
@@ -153,7 +155,7 @@ class CategoryService:
         self,
         old_category_input: str,
         new_category_input: str,
-        transaction_type_input: str,
+        transaction_type_input: str | TransactionType,
     ):
         """
         Edit a category's name.
@@ -161,7 +163,7 @@ class CategoryService:
         Args:
             old_category_input (str): Current category name.
             new_category_input (str): New category name.
-            transaction_type_input (str): Transaction type.
+            transaction_type_input (str | TransactionType): Transaction type.
 
         Returns:
             Category: Updated category object.
@@ -220,13 +222,15 @@ class CategoryService:
 
         return old_category
 
-    def delete_category(self, category_name: str, transaction_type_input: str) -> bool:
+    def delete_category(
+        self, category_name: str, transaction_type_input: str | TransactionType
+    ) -> bool:
         """
         Delete a category with given name and category type
 
         Args:
             category_name (str): Category name.
-            transaction_type_input (str): Transaction type.
+            transaction_type_input (str | TransactionType): Transaction type.
 
         Returns:
             bool: True if deleted successfully.
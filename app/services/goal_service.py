@@ -6,7 +6,7 @@ import logging
 from datetime import datetime, date
 from decimal import Decimal
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.database.models import Goal, Transaction, TransactionType
 from app.exception import InvalidInputError, NotFoundError, AlreadyExistsError
@@ -143,8 +143,12 @@ class GoalService:
         Returns:
             List of Goal objects
         """
+        # Eager-load the linked account so progress cards don't lazy-load it per goal
         goals = (
-            self.db_session.query(Goal).order_by(Goal.is_completed, Goal.deadline).all()
+            self.db_session.query(Goal)
+            .options(joinedload(Goal.account))
+            .order_by(Goal.is_completed, Goal.deadline)
+            .all()
         )
         logger.info(f"Retrieved {len(goals)} goals")
         return goals
@@ -158,6 +162,7 @@ class GoalService:
         """
         goals = (
             self.db_session.query(Goal)
+            .options(joinedload(Goal.account))
             .filter(Goal.is_completed == 0)
             .order_by(Goal.deadline)
             .all()
@@ -5,6 +5,7 @@ import logging
 import warnings
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 from sqlalchemy.orm import Session
 from statsmodels.tsa.holtwinters import SimpleExpSmoothing
@@ -28,6 +29,33 @@ warnings.filterwarnings(
 )
 
 
+@lru_cache(maxsize=128)
+def _forecast_next(historical_values: tuple) -> float:
+    """
+    Fit Simple Exponential Smoothing and forecast one period ahead.
+
+    Cached on the history so that reruns over unchanged data skip the fit.
+
+    Args:
+        historical_values (tuple): Monthly totals from oldest to newest.
+
+    Returns:
+        float: Predicted value for the next month.
+    """
+    # Suppress numpy/statsmodels warnings during model fitting
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+
+        # Create and fit model
+        model = SimpleExpSmoothing(list(historical_values))
+        fitted_model = model.fit(optimized=True)
+
+        # Forecast next period
+        prediction = fitted_model.forecast(1)[0]
+
+    return float(prediction)
+
+
 class PredictionService:
     """Service for spending predictions"""
 
@@ -303,18 +331,7 @@ class PredictionService:
             if len(set(historical_values)) == 1:
                 return historical_values[0]
 
-            # Suppress numpy/statsmodels warnings during model fitting
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore")
-
-                # Create and fit model
-                model = SimpleExpSmoothing(historical_values)
-                fitted_model = model.fit(optimized=True)
-
-                # Forecast next period
-                prediction = fitted_model.forecast(1)[0]
-
-            return float(prediction)
+            return _forecast_next(tuple(historical_values))
 
         except Exception:
             # Fallback to simple average
@@ -4,9 +4,10 @@ import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import desc, func
 from sqlalchemy.orm import Session
 
-from app.database.models import Transaction, TransactionType
+from app.database.models import Category, Transaction, TransactionType
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,42 @@ class SummaryService:
             query = query.filter(Transaction.transaction_type == transaction_type)
         return query.all()
 
+    def _get_totals_by_category(
+        self,
+        start: datetime,
+        end: datetime,
+        transaction_type: TransactionType,
+    ) -> list[tuple[str, Decimal]]:
+        """
+        Sum MYR amounts per category within a datetime range.
+
+        Aggregation and ordering are done by the database so only one row
+        per category is returned.
+
+        Args:
+            start (datetime): Start datetime.
+            end (datetime): End datetime.
+            transaction_type (TransactionType): Type of transactions to sum.
+
+        Returns:
+            list[tuple[str, Decimal]]: (category name, total) pairs, largest total first.
+        """
+
+        total = func.sum(Transaction.amount_in_myr).label("total")
+        rows = (
+            self.db_session.query(Category.name, total)
+            .join(Transaction.category)
+            .filter(
+                Transaction.transaction_type == transaction_type,
+                Transaction.datetime >= start,
+                Transaction.datetime <= end,
+            )
+            .group_by(Category.name)
+            .order_by(desc(total))
+            .all()
+        )
+        return [(name, amount) for name, amount in rows]
+
     def get_daily_summary(self, date: datetime):
         """
         Generate a summary for a specific day.
@@ -67,7 +104,7 @@ class SummaryService:
             date (datetime): The date for which to generate the summary.
 
         Returns:
-            dict: Summary containing total income, expenses, net balance, and count of transactions.
+            dict: Summary containing total income, expenses, net balance (as floats, for display), and count of transactions.
         """
         logger.info(f"Generating daily summary for {date.strftime('%d-%m-%Y')}")
 
@@ -97,9 +134,9 @@ class SummaryService:
 
         return {
             "date": date.strftime("%d-%m-%Y"),
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "net": net,
+            "total_income": float(total_income),
+            "total_expense": float(total_expense),
+            "net": float(net),
             "transaction_count": len(transactions),
         }
 
@@ -111,7 +148,7 @@ class SummaryService:
             date (datetime): Any date within the desired week.
 
         Returns:
-            dict: Summary with totals for income, expenses, net balance, and transaction count.
+            dict: Summary with totals for income, expenses, net balance (as floats, for display), and transaction count.
         """
         logger.info(
             f"Generating weekly summary for week containing {date.strftime('%d-%m-%Y')}"
@@ -148,9 +185,9 @@ class SummaryService:
         return {
             "week_start": week_start.strftime("%d-%m-%Y"),
             "week_end": week_end.strftime("%d-%m-%Y"),
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "net": net,
+            "total_income": float(total_income),
+            "total_expense": float(total_expense),
+            "net": float(net),
             "transaction_count": len(transactions),
         }
 
@@ -163,7 +200,7 @@ class SummaryService:
             month (int): Month number (1-12).
 
         Returns:
-            dict: Summary with totals for income, expenses, net balance, and transaction count.
+            dict: Summary with totals for income, expenses, net balance (as floats, for display), and transaction count.
                   Returns an empty dict if year/month are invalid.
         """
         logger.info(f"Generating monthly summary for {month}/{year}")
@@ -202,15 +239,15 @@ class SummaryService:
         return {
             "month": month_name,
             "year": year,
-            "total_income": total_income,
-            "total_expense": total_expense,
-            "net": net,
+            "total_income": float(total_income),
+            "total_expense": float(total_expense),
+            "net": float(net),
             "transaction_count": len(transactions),
         }
 
     def get_expenses_by_category(
         self, start_date: datetime, end_date: datetime
-    ) -> dict:
+    ) -> list[tuple[str, Decimal]]:
         """
         Summarize expenses by category for a date range.
 
@@ -219,7 +256,8 @@ class SummaryService:
             end_date (datetime): End date.
 
         Returns:
-            dict: Mapping of category name to total expense (MYR).
+            list[tuple[str, Decimal]]: (category name, total expense in MYR) pairs,
+                sorted by total in descending order.
         """
         logger.info(
             f"Getting expenses by category from {start_date.date()} to {end_date.date()}"
@@ -228,29 +266,23 @@ class SummaryService:
         # Validate dates
         if start_date > end_date:
             logger.warning("Invalid date range: start_date > end_date")
-            return {}
+            return []
 
         # Set time boundaries
         start_of_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        # Filter expense transactions for this date range
-        transactions = self._get_transactions_in_range(
-            start_of_day, end_of_day, transaction_type=TransactionType.EXPENSE
+        # Sum stored MYR amounts per category, largest first
+        expenses_by_category = self._get_totals_by_category(
+            start_of_day, end_of_day, TransactionType.EXPENSE
         )
 
-        expenses_by_category = {}
-        for t in transactions:
-            cat_name = t.category.name
-            # Use stored MYR amount for consistency
-            expenses_by_category[cat_name] = (
-                expenses_by_category.get(cat_name, Decimal("0.00")) + t.amount_in_myr
-            )
-
         logger.info(f"Expenses by category: {len(expenses_by_category)} categories")
         return expenses_by_category
 
-    def get_income_by_category(self, start_date: datetime, end_date: datetime) -> dict:
+    def get_income_by_category(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[tuple[str, Decimal]]:
         """
         Summarize income by category for a date range.
 
@@ -259,7 +291,8 @@ class SummaryService:
             end_date (datetime): End date.
 
         Returns:
-            dict: Mapping of category name to total income (MYR).
+            list[tuple[str, Decimal]]: (category name, total income in MYR) pairs,
+                sorted by total in descending order.
         """
         logger.info(
             f"Getting income by category from {start_date.date()} to {end_date.date()}"
@@ -268,24 +301,16 @@ class SummaryService:
         # Validate dates
         if start_date > end_date:
             logger.warning("Invalid date range: start_date > end_date")
-            return {}
+            return []
 
         # Set time boundaries
         start_of_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        # Filter income transactions for this date range
-        transactions = self._get_transactions_in_range(
-            start_of_day, end_of_day, transaction_type=TransactionType.INCOME
+        # Sum stored MYR amounts per category, largest first
+        income_by_category = self._get_totals_by_category(
+            start_of_day, end_of_day, TransactionType.INCOME
         )
 
-        income_by_category = {}
-        for t in transactions:
-            cat_name = t.category.name
-            # Use stored MYR amount for consistency
-            income_by_category[cat_name] = (
-                income_by_category.get(cat_name, Decimal("0.00")) + t.amount_in_myr
-            )
-
         logger.info(f"Income by category: {len(income_by_category)} categories")
         return income_by_category
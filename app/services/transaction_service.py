@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.currency import validate_currency
 from app.database.models import Transaction, TransactionType
@@ -70,7 +70,11 @@ class TransactionService:
             list[Transaction]: List of transaction objects.
         """
 
-        query = self.db_session.query(Transaction)
+        # Load account and category in the same query so callers reading
+        # t.account / t.category don't trigger one lazy SELECT per row
+        query = self.db_session.query(Transaction).options(
+            joinedload(Transaction.account), joinedload(Transaction.category)
+        )
 
         if reverse_chronological:
             query = query.order_by(Transaction.datetime.desc())
@@ -64,12 +64,15 @@ def validate_non_empty_string(value: str, field_name: str = "Value") -> str:
     return stripped_value
 
 
-def validate_transaction_type(transaction_type_input: str) -> TransactionType:
+def validate_transaction_type(
+    transaction_type_input: str | TransactionType,
+) -> TransactionType:
     """
     Convert string to TransactionType enum.
 
     Args:
-        transaction_type_input: Input string representing transaction type.
+        transaction_type_input: Input string representing transaction type,
+            or a TransactionType, which is returned unchanged.
 
     Returns:
         TransactionType: Corresponding TransactionType enum.
@@ -77,6 +80,9 @@ def validate_transaction_type(transaction_type_input: str) -> TransactionType:
     Raises:
         InvalidInputError: If the type is not valid.
     """
+    if isinstance(transaction_type_input, TransactionType):
+        return transaction_type_input
+
     try:
         return TransactionType(transaction_type_input.strip().lower())
     except ValueError:
@@ -140,6 +140,8 @@ def add_account_view(account_service: AccountService):
                     currency=currency,
                 )
 
+                utility.get_account_names.clear()
+
                 # Show success message with conversion info
                 success_msg = f"Account '{new_account.account_name}' created successfully with balance RM {new_account.balance:,.2f}!"
 
@@ -195,6 +197,9 @@ def edit_account_view(account_service: AccountService):
                     old_name=old_name, new_name=new_name
                 )
 
+                utility.get_account_names.clear()
+                utility.bump_transaction_version()
+
                 utility.success_popup(
                     f"Account renamed from '{old_name}' to '{updated_account.account_name}' successfully!"
                 )
@@ -258,6 +263,9 @@ def delete_account_view(account_service: AccountService):
                 # Delete the account
                 account_service.delete_account(account_name)
 
+                utility.get_account_names.clear()
+                utility.bump_transaction_version()
+
                 utility.success_popup(
                     f"Account '{account_name}' and all associated transactions deleted successfully!"
                 )
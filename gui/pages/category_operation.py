@@ -119,6 +119,8 @@ def add_category_view(category_service: CategoryService):
                     category=category_name, transaction_type_input=transaction_type
                 )
 
+                utility.get_category_names.clear()
+
                 utility.success_popup(
                     f"{transaction_type} category '{new_category.name}' created successfully!"
                 )
@@ -189,6 +191,9 @@ def edit_category_view(category_service: CategoryService):
                     transaction_type_input=transaction_type,
                 )
 
+                utility.get_category_names.clear()
+                utility.bump_transaction_version()
+
                 utility.success_popup(
                     f"Category renamed from '{old_name}' to '{updated_category.name}' successfully!"
                 )
@@ -257,6 +262,7 @@ def delete_category_view(category_service: CategoryService):
                 utility.warning_popup(
                     "Please confirm deletion by checking the checkbox above."
                 )
+                return
 
             try:
                 # Delete the category
@@ -264,13 +270,12 @@ def delete_category_view(category_service: CategoryService):
                     category_name=category_name, transaction_type_input=transaction_type
                 )
 
+                utility.get_category_names.clear()
+
                 utility.success_popup(
                     f"{transaction_type} category '{category_name}' deleted successfully!"
                 )
 
-                # Rerun to refresh the view
-                st.rerun()
-
             except InvalidInputError as e:
                 utility.error_popup(f"Invalid input: {e}")
             except NotFoundError as e:
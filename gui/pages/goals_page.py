@@ -32,36 +32,43 @@ def show_goals_page():
     )
 
     try:
+        # Fetch goals once per rerun and share them between tabs
+        all_goals = goal_service.get_all_goals()
+        active_goals = [g for g in all_goals if not g.is_completed]
+
         with tab1:
-            add_goal_view(goal_service, account_service)
+            add_goal_view(goal_service)
 
         with tab2:
-            view_goals_view(goal_service)
+            view_goals_view(goal_service, all_goals)
 
         with tab3:
-            edit_goal_view(goal_service)
+            edit_goal_view(goal_service, active_goals)
 
         with tab4:
-            delete_goal_view(goal_service)
+            delete_goal_view(goal_service, all_goals)
 
     finally:
         db_session.close()
 
 
-def add_goal_view(goal_service: GoalService, account_service: AccountService):
+def add_goal_view(goal_service: GoalService):
     """Tab for adding a new goal."""
 
     st.header("Create New Goal")
 
-    # Goal name
-    name = st.text_input(
-        "Goal Name",
-        help="Give your goal a descriptive name",
-    )
+    today = date.today()
+
+    # Inputs live in a form so the page only reruns when the goal is submitted
+    with st.form("add_goal_form"):
+
+        # Goal name
+        name = st.text_input(
+            "Goal Name",
+            help="Give your goal a descriptive name",
+        )
 
-    # Target amount
-    col1, col2 = st.columns([2, 1])
-    with col1:
+        # Target amount
         target_amount = st.number_input(
             "Target Amount (RM)",
             min_value=0.01,
@@ -70,77 +77,71 @@ def add_goal_view(goal_service: GoalService, account_service: AccountService):
             help="How much do you want to save?",
         )
 
-    with col2:
-        # Display in nice format
-        if target_amount > 0:
-            st.metric("Target", f"RM {target_amount:,.2f}")
-
-    # Deadline
-    deadline = st.date_input(
-        "Deadline",
-        min_value=date.today(),
-        value=date.today(),
-        help="When do you want to achieve this goal?",
-    )
-
-    # Optional: Link to account
-    accounts = account_service.get_all_accounts()
-    account_options = ["All Accounts (Track Total Balance)"] + [
-        acc.account_name for acc in accounts
-    ]
-    account_selection = st.selectbox(
-        "Track Progress From",
-        account_options,
-        help="Link to a specific account, or track total balance",
-    )
-
-    # Description
-    description = st.text_area(
-        "Description (Optional)",
-        placeholder="Add notes about this goal...",
-        height=100,
-    )
-
-    # Submit button
-    if st.button("Create Goal"):
-        if not name or not name.strip():
-            utility.error_popup("Please enter a goal name")
+        # Deadline
+        deadline = st.date_input(
+            "Deadline",
+            min_value=today,
+            value=today,
+            help="When do you want to achieve this goal?",
+        )
 
-        elif target_amount <= 0:
-            utility.error_popup("Target amount must be greater than 0")
+        # Optional: Link to account (names are cached so reruns don't re-query)
+        account_options = [
+            "All Accounts (Track Total Balance)"
+        ] + utility.get_account_names()
+        account_selection = st.selectbox(
+            "Track Progress From",
+            account_options,
+            help="Link to a specific account, or track total balance",
+        )
 
-        elif deadline <= date.today():
-            utility.error_popup("Deadline must be in the future")
+        # Description
+        description = st.text_area(
+            "Description (Optional)",
+            placeholder="Add notes about this goal...",
+            height=100,
+        )
 
-        else:
-            try:
-                # Determine account name
-                account_name = None
-                if account_selection != "All Accounts (Track Total Balance)":
-                    account_name = account_selection
-
-                # Create goal
-                goal_service.add_goal(
-                    name=name,
-                    target_amount=str(target_amount),
-                    deadline=deadline,
-                    account_name=account_name,
-                    description=description,
-                )
+        # Submit button
+        submitted = st.form_submit_button("Create Goal")
+
+        if submitted:
+            if not name or not name.strip():
+                utility.error_popup("Please enter a goal name")
+
+            elif target_amount <= 0:
+                utility.error_popup("Target amount must be greater than 0")
+
+            elif deadline <= today:
+                utility.error_popup("Deadline must be in the future")
+
+            else:
+                try:
+                    # Determine account name
+                    account_name = None
+                    if account_selection != "All Accounts (Track Total Balance)":
+                        account_name = account_selection
+
+                    # Create goal
+                    goal_service.add_goal(
+                        name=name,
+                        target_amount=str(target_amount),
+                        deadline=deadline,
+                        account_name=account_name,
+                        description=description,
+                    )
 
-                utility.success_popup(f"Goal '{name}' created successfully!")
+                    utility.success_popup(f"Goal '{name}' created successfully!")
 
-            except (InvalidInputError, NotFoundError) as e:
-                utility.error_popup(f"Error: {e}")
+                except (InvalidInputError, NotFoundError) as e:
+                    utility.error_popup(f"Error: {e}")
 
 
-def view_goals_view(goal_service: GoalService):
+def view_goals_view(goal_service: GoalService, goals: list[Goal]):
     """Tab for viewing all goals with progress."""
 
     st.header("Your Goals")
 
-    goals = goal_service.get_all_goals()
-
     if not goals:
         st.info("No goals yet. Create your first goal to start tracking progress!")
         return
@@ -276,18 +277,18 @@ def display_goal_card(goal: Goal, goal_service: GoalService, is_completed=False)
                 st.write(goal.description)
 
 
-def edit_goal_view(goal_service: GoalService):
-    """Tab for editing an existing goal."""
+def edit_goal_view(goal_service: GoalService, goals: list[Goal]):
+    """Tab for editing an existing (active) goal."""
 
     st.header("Edit Goal")
 
-    goals = goal_service.get_active_goals()
+    today = date.today()
 
     if not goals:
         st.info("No active goals to edit")
         return
 
-    # Select goal
+    # Select goal (outside the form so the fields below refresh on selection)
     goal_names = [f"{g.name} (Target: RM {g.target_amount:,.2f})" for g in goals]
     selected_index = st.selectbox(
         "Select Goal to Edit",
@@ -299,74 +300,74 @@ def edit_goal_view(goal_service: GoalService):
         goal = goals[selected_index]
 
         # Edit form
-        name = st.text_input("Goal Name", value=goal.name)
-
-        target_amount = st.number_input(
-            "Target Amount (RM)",
-            min_value=0.01,
-            value=float(goal.target_amount),
-            step=100.0,
-            format="%.2f",
-        )
+        with st.form("edit_goal_form"):
+            name = st.text_input("Goal Name", value=goal.name)
+
+            target_amount = st.number_input(
+                "Target Amount (RM)",
+                min_value=0.01,
+                value=float(goal.target_amount),
+                step=100.0,
+                format="%.2f",
+            )
 
-        current_deadline = (
-            goal.deadline.date()
-            if isinstance(goal.deadline, datetime)
-            else goal.deadline
-        )
-        deadline = st.date_input(
-            "Deadline",
-            min_value=date.today(),
-            value=current_deadline,
-        )
+            current_deadline = (
+                goal.deadline.date()
+                if isinstance(goal.deadline, datetime)
+                else goal.deadline
+            )
+            deadline = st.date_input(
+                "Deadline",
+                min_value=today,
+                value=current_deadline,
+            )
 
-        description = st.text_area(
-            "Description (Optional)",
-            value=goal.description or "",
-            height=100,
-        )
+            description = st.text_area(
+                "Description (Optional)",
+                value=goal.description or "",
+                height=100,
+            )
 
-        # Submit button
-        if st.button("Save Changes"):
-            try:
-                goal_service.edit_goal(
-                    goal_id=goal.id,
-                    name=name,
-                    target_amount=str(target_amount),
-                    deadline=deadline,
-                    description=description,
-                )
+            # Submit button
+            submitted = st.form_submit_button("Save Changes")
+
+            if submitted:
+                try:
+                    goal_service.edit_goal(
+                        goal_id=goal.id,
+                        name=name,
+                        target_amount=str(target_amount),
+                        deadline=deadline,
+                        description=description,
+                    )
 
-                utility.success_popup("Goal updated successfully!")
+                    utility.success_popup("Goal updated successfully!")
 
-            except (InvalidInputError, NotFoundError) as e:
-                utility.error_popup(f"Error: {e}")
+                except (InvalidInputError, NotFoundError) as e:
+                    utility.error_popup(f"Error: {e}")
 
 
-def delete_goal_view(goal_service: GoalService):
+def delete_goal_view(goal_service: GoalService, goals: list[Goal]):
     """Tab for deleting a goal."""
 
     st.header("Delete Goal")
 
-    goals = goal_service.get_all_goals()
-
     if not goals:
         st.info("No goals to delete")
         return
 
-    # Select goal
     goal_names = [
         f"{g.name} (Target: RM {g.target_amount:,.2f}, Status: {'Completed' if g.is_completed else 'Active'})"
         for g in goals
     ]
-    selected_index = st.selectbox(
-        "Select Goal to Delete",
-        range(len(goal_names)),
-        format_func=lambda x: goal_names[x],
-    )
 
-    if selected_index is not None:
-        goal = goals[selected_index]
+    with st.form("delete_goal_form"):
+        # Select goal
+        selected_index = st.selectbox(
+            "Select Goal to Delete",
+            range(len(goal_names)),
+            format_func=lambda x: goal_names[x],
+        )
 
         st.error(
             "**Warning:** This action cannot be undone. The goal and its progress history will be permanently deleted."
@@ -379,13 +380,17 @@ def delete_goal_view(goal_service: GoalService):
         )
 
         # Delete button
-        if st.button("Delete Goal"):
+        submitted = st.form_submit_button("Delete Goal")
+
+        if submitted and selected_index is not None:
             if not confirm:
                 utility.warning_popup(
                     "Please confirm deletion by checking the checkbox above."
                 )
                 return
 
+            goal = goals[selected_index]
+
             try:
                 goal_service.delete_goal(goal.id)
                 utility.success_popup(f"Goal '{goal.name}' deleted successfully")
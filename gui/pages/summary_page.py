@@ -1,7 +1,8 @@
 # gui/pages/summary_page.py
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
@@ -12,6 +13,15 @@ from app.services.category_service import CategoryService
 from app.services.currency_service import CurrencyService
 from app.services.summary_service import SummaryService
 
+# Midnight, used to turn picked dates into datetimes
+_MIN_TIME = time(0, 0)
+
+# Display formats for the numeric columns of the by-category tables
+CATEGORY_COLUMN_CONFIG = {
+    "Amount": st.column_config.NumberColumn(format="RM %.2f"),
+    "Percentage": st.column_config.NumberColumn(format="%.1f%%"),
+}
+
 
 def show_summary_page():
     """Display the summary page"""
@@ -63,16 +73,18 @@ def daily_summary_view(summary_service: SummaryService):
 
     st.header("Daily Summary")
 
+    today = date.today()
+
     # Date picker
     selected_date = st.date_input(
         "Select Date",
-        value=datetime.now(),
+        value=today,
         help="Choose a date to view the financial summary",
     )
 
     if selected_date:
         # Convert date to datetime
-        date_obj = datetime.combine(selected_date, datetime.min.time())
+        date_obj = datetime.combine(selected_date, _MIN_TIME)
 
         # Get summary
         summary = summary_service.get_daily_summary(date_obj)
@@ -100,18 +112,15 @@ def daily_summary_view(summary_service: SummaryService):
 
             st.subheader("Visual Breakdown")
 
-            # Create pie chart
-            chart_data = pd.DataFrame(
-                {
-                    "Category": ["Income", "Expenses"],
-                    "Amount": [
-                        float(summary["total_income"]),
-                        float(summary["total_expense"]),
-                    ],
-                }
-            )
-
-            if chart_data["Amount"].sum() > 0:
+            # Skip building the chart when there is nothing to plot
+            if summary["total_income"] + summary["total_expense"] > 0:
+                # Create pie chart
+                chart_data = pd.DataFrame(
+                    {
+                        "Category": ["Income", "Expenses"],
+                        "Amount": [summary["total_income"], summary["total_expense"]],
+                    }
+                )
                 fig = px.pie(
                     chart_data,
                     values="Amount",
@@ -132,16 +141,18 @@ def weekly_summary_view(summary_service: SummaryService):
 
     st.header("Weekly Summary")
 
+    today = date.today()
+
     # Date picker for any day in the week
     selected_date = st.date_input(
         "Select any date in the week",
-        value=datetime.now(),
+        value=today,
         help="Choose a date, and the summary will show the entire week containing that date",
     )
 
     if selected_date:
         # Convert date to datetime
-        date_obj = datetime.combine(selected_date, datetime.min.time())
+        date_obj = datetime.combine(selected_date, _MIN_TIME)
 
         # Get summary
         summary = summary_service.get_weekly_summary(date_obj)
@@ -167,18 +178,15 @@ def weekly_summary_view(summary_service: SummaryService):
             st.divider()
             st.subheader("Visual Breakdown")
 
-            # Create pie chart
-            chart_data = pd.DataFrame(
-                {
-                    "Category": ["Income", "Expenses"],
-                    "Amount": [
-                        float(summary["total_income"]),
-                        float(summary["total_expense"]),
-                    ],
-                }
-            )
-
-            if chart_data["Amount"].sum() > 0:
+            # Skip building the chart when there is nothing to plot
+            if summary["total_income"] + summary["total_expense"] > 0:
+                # Create pie chart
+                chart_data = pd.DataFrame(
+                    {
+                        "Category": ["Income", "Expenses"],
+                        "Amount": [summary["total_income"], summary["total_expense"]],
+                    }
+                )
                 fig = px.pie(
                     chart_data,
                     values="Amount",
@@ -199,6 +207,8 @@ def monthly_summary_view(summary_service: SummaryService):
 
     st.header("Monthly Summary")
 
+    today = date.today()
+
     # Month and year pickers
     col1, col2 = st.columns(2)
     with col1:
@@ -206,10 +216,10 @@ def monthly_summary_view(summary_service: SummaryService):
             "Select Month",
             options=list(range(1, 13)),
             format_func=lambda x: datetime(2000, x, 1).strftime("%B"),
-            index=datetime.now().month - 1,
+            index=today.month - 1,
         )
     with col2:
-        current_year = datetime.now().year
+        current_year = today.year
         selected_year = st.number_input(
             "Select Year",
             min_value=2000,
@@ -243,19 +253,15 @@ def monthly_summary_view(summary_service: SummaryService):
             st.divider()
             st.subheader("Visual Breakdown")
 
-            # Create comparison chart
-            chart_data = pd.DataFrame(
-                {
-                    "Category": ["Income", "Expenses"],
-                    "Amount": [
-                        float(summary["total_income"]),
-                        float(summary["total_expense"]),
-                    ],
-                }
-            )
-
-            # Pie chart
-            if chart_data["Amount"].sum() > 0:
+            # Skip building the chart when there is nothing to plot
+            if summary["total_income"] + summary["total_expense"] > 0:
+                # Create comparison chart
+                chart_data = pd.DataFrame(
+                    {
+                        "Category": ["Income", "Expenses"],
+                        "Amount": [summary["total_income"], summary["total_expense"]],
+                    }
+                )
                 fig = px.pie(
                     chart_data,
                     values="Amount",
@@ -278,18 +284,20 @@ def expenses_by_category_view(summary_service: SummaryService):
 
     st.header("Expenses by Category")
 
+    today = date.today()
+
     # Date range picker
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input(
             "Start Date",
-            value=datetime.now() - timedelta(days=30),
+            value=today - timedelta(days=30),
             help="Start of the date range",
         )
     with col2:
         end_date = st.date_input(
             "End Date",
-            value=datetime.now(),
+            value=today,
             help="End of the date range",
         )
 
@@ -298,8 +306,8 @@ def expenses_by_category_view(summary_service: SummaryService):
             st.error("Start date must be before or equal to end date.")
         else:
             # Convert dates to datetime
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.min.time())
+            start_datetime = datetime.combine(start_date, _MIN_TIME)
+            end_datetime = datetime.combine(end_date, _MIN_TIME)
 
             # Get expenses by category
             expenses = summary_service.get_expenses_by_category(
@@ -314,43 +322,42 @@ def expenses_by_category_view(summary_service: SummaryService):
                 )
 
                 # Calculate total
-                total_expenses = sum(expenses.values())
+                total_expenses = sum(amount for _, amount in expenses)
 
                 # Display total
                 st.metric("Total Expenses", f"RM {total_expenses:,.2f}")
 
                 st.divider()
 
-                # Create DataFrame
+                # Create DataFrame once, shared by the table and the pie chart
+                # (rows already arrive sorted by amount from the service)
                 expense_data = pd.DataFrame(
-                    [
-                        {
-                            "Category": cat,
-                            "Amount": float(amount),
-                            "Percentage": f"{(float(amount)/float(total_expenses)*100):.1f}%",
-                        }
-                        for cat, amount in sorted(
-                            expenses.items(), key=lambda x: x[1], reverse=True
-                        )
-                    ]
+                    {
+                        "Category": [cat for cat, _ in expenses],
+                        "Amount": np.fromiter(
+                            (amount for _, amount in expenses), dtype=np.float64
+                        ),
+                    }
+                )
+                expense_data["Percentage"] = (
+                    expense_data["Amount"] / expense_data["Amount"].sum() * 100
                 )
 
                 # Display table
-                st.dataframe(expense_data, use_container_width=True, hide_index=True)
+                st.dataframe(
+                    expense_data,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config=CATEGORY_COLUMN_CONFIG,
+                )
 
                 # Visual representation
                 st.divider()
                 st.subheader("Visual Breakdown")
 
                 # Pie chart
-                chart_data = pd.DataFrame(
-                    [
-                        {"Category": cat, "Amount": float(amount)}
-                        for cat, amount in expenses.items()
-                    ]
-                )
                 fig = px.pie(
-                    chart_data,
+                    expense_data,
                     values="Amount",
                     names="Category",
                     title="Expenses Distribution",
@@ -370,19 +377,21 @@ def income_by_category_view(summary_service: SummaryService):
 
     st.header("Income by Category")
 
+    today = date.today()
+
     # Date range picker
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input(
             "Start Date",
-            value=datetime.now() - timedelta(days=30),
+            value=today - timedelta(days=30),
             help="Start of the date range",
             key="income_start",
         )
     with col2:
         end_date = st.date_input(
             "End Date",
-            value=datetime.now(),
+            value=today,
             help="End of the date range",
             key="income_end",
         )
@@ -392,8 +401,8 @@ def income_by_category_view(summary_service: SummaryService):
             st.error("Start date must be before or equal to end date.")
         else:
             # Convert dates to datetime
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.min.time())
+            start_datetime = datetime.combine(start_date, _MIN_TIME)
+            end_datetime = datetime.combine(end_date, _MIN_TIME)
 
             # Get income by category
             income = summary_service.get_income_by_category(
@@ -408,43 +417,42 @@ def income_by_category_view(summary_service: SummaryService):
                 )
 
                 # Calculate total
-                total_income = sum(income.values())
+                total_income = sum(amount for _, amount in income)
 
                 # Display total
                 st.metric("Total Income", f"RM {total_income:,.2f}")
 
                 st.divider()
 
-                # Create DataFrame
+                # Create DataFrame once, shared by the table and the pie chart
+                # (rows already arrive sorted by amount from the service)
                 income_data = pd.DataFrame(
-                    [
-                        {
-                            "Category": cat,
-                            "Amount": float(amount),
-                            "Percentage": f"{(float(amount)/float(total_income)*100):.1f}%",
-                        }
-                        for cat, amount in sorted(
-                            income.items(), key=lambda x: x[1], reverse=True
-                        )
-                    ]
+                    {
+                        "Category": [cat for cat, _ in income],
+                        "Amount": np.fromiter(
+                            (amount for _, amount in income), dtype=np.float64
+                        ),
+                    }
+                )
+                income_data["Percentage"] = (
+                    income_data["Amount"] / income_data["Amount"].sum() * 100
                 )
 
                 # Display table
-                st.dataframe(income_data, use_container_width=True, hide_index=True)
+                st.dataframe(
+                    income_data,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config=CATEGORY_COLUMN_CONFIG,
+                )
 
                 # Visual representation
                 st.divider()
                 st.subheader("Visual Breakdown")
 
                 # Pie chart
-                chart_data = pd.DataFrame(
-                    [
-                        {"Category": cat, "Amount": float(amount)}
-                        for cat, amount in income.items()
-                    ]
-                )
                 fig = px.pie(
-                    chart_data,
+                    income_data,
                     values="Amount",
                     names="Category",
                     title="Income Distribution",
@@ -1,8 +1,11 @@
 # gui/pages/transaction_operation_page.py
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -18,19 +21,80 @@ from app.services.currency_service import CurrencyService
 from app.services.transaction_service import TransactionService
 from app.utility import format_amount
 
+# Currency code -> symbol, built once instead of per rendered row
+CURRENCY_SYMBOLS = {code: get_currency_symbol(code) for code in get_currency_list()}
+
+
+@dataclass(frozen=True)
+class TransactionRow:
+    """Plain, session-independent copy of a transaction for display."""
+
+    id: int
+    datetime: datetime
+    transaction_type: TransactionType
+    category_name: str
+    account_name: str
+    amount: Decimal
+    currency: str
+    amount_in_myr: Decimal
+    description: str
+    label: str
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_transactions(version: int) -> tuple[TransactionRow, ...]:
+    """
+    Return all transactions (newest first), cached across reruns.
+
+    The version argument only serves as the cache key: pass
+    utility.get_transaction_version(), and call utility.bump_transaction_version()
+    after a transaction is added, edited or deleted so the next call, in any
+    session, reloads from the database.
+    """
+    db_session = SessionLocal()
+    try:
+        currency_service = CurrencyService(db_session)
+        transaction_service = TransactionService(
+            db_session,
+            AccountService(db_session, currency_service),
+            CategoryService(db_session),
+            currency_service,
+        )
+        return tuple(
+            TransactionRow(
+                id=t.id,
+                datetime=t.datetime,
+                transaction_type=t.transaction_type,
+                category_name=t.category.name,
+                account_name=t.account.account_name,
+                amount=t.amount,
+                currency=t.currency,
+                amount_in_myr=t.amount_in_myr,
+                description=t.description,
+                # Selectbox label, rendered once per load for the edit/delete tabs
+                label=f"ID {t.id} - {t.datetime.strftime('%Y-%m-%d')} - {t.category.name} - {CURRENCY_SYMBOLS.get(t.currency, t.currency)}{t.amount:,.2f}",
+            )
+            for t in transaction_service.get_all_transactions()
+        )
+    finally:
+        db_session.close()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cached_exchange_rate(currency: str) -> Decimal:
+    """Return the exchange rate from currency to MYR, cached for five minutes."""
+    db_session = SessionLocal()
+    try:
+        return CurrencyService(db_session).get_exchange_rate(currency)
+    finally:
+        db_session.close()
+
 
 def show_transaction_operation_page():
     """Display the transaction operations page"""
 
-    # Create database session and services
-    db_session = SessionLocal()
-    currency_service = CurrencyService(db_session)
-    account_service = AccountService(db_session, currency_service)
-    category_service = CategoryService(db_session)
-    budget_service = BudgetService(db_session, category_service)
-    transaction_service = TransactionService(
-        db_session, account_service, category_service, currency_service
-    )
+    # Reuse this browser session's database session and services
+    services = get_services()
 
     st.title("Transaction Operations")
 
@@ -46,39 +110,71 @@ def show_transaction_operation_page():
 
     try:
         with tab1:
-            add_transaction_view(
-                transaction_service,
-                account_service,
-                category_service,
-                budget_service,
-                currency_service,
-            )
+            add_transaction_view(services.transaction, services.budget)
 
         with tab2:
-            view_transactions_view(
-                transaction_service, account_service, category_service, currency_service
-            )
+            view_transactions_view()
 
         with tab3:
-            edit_transaction_view(
-                transaction_service, account_service, category_service
-            )
+            edit_transaction_view(services.transaction)
 
         with tab4:
-            delete_transaction_view(transaction_service)
+            delete_transaction_view(services.transaction)
 
     finally:
-        db_session.close()
+        # Release the connection and loaded objects; the session reconnects on next use
+        services.db_session.close()
+
+
+class TransactionPageServices:
+    """Database session and services for this page, each service created on first use."""
+
+    def __init__(self) -> None:
+        self.db_session = SessionLocal()
+
+    @cached_property
+    def currency(self) -> CurrencyService:
+        return CurrencyService(self.db_session)
+
+    @cached_property
+    def account(self) -> AccountService:
+        return AccountService(self.db_session, self.currency)
+
+    @cached_property
+    def category(self) -> CategoryService:
+        return CategoryService(self.db_session)
+
+    @cached_property
+    def budget(self) -> BudgetService:
+        return BudgetService(self.db_session, self.category)
 
+    @cached_property
+    def transaction(self) -> TransactionService:
+        return TransactionService(
+            self.db_session, self.account, self.category, self.currency
+        )
+
+
+def get_services() -> TransactionPageServices:
+    """
+    Return the services for this page, kept in session state for the
+    lifetime of the browser session.
+    """
+    if "transaction_page_services" not in st.session_state:
+        st.session_state["transaction_page_services"] = TransactionPageServices()
+    return st.session_state["transaction_page_services"]
 
+
+@st.fragment
 def add_transaction_view(
-    transaction_service: TransactionService,
-    account_service: AccountService,
-    category_service: CategoryService,
-    budget_service: BudgetService,
-    currency_service: CurrencyService,
+    transaction_service: TransactionService, budget_service: BudgetService
 ):
-    """Tab for adding a new transaction."""
+    """
+    Tab for adding a new transaction.
+
+    Runs as a fragment so typing an amount or switching currency only reruns
+    this tab (and its live budget warning), not the whole page.
+    """
 
     st.header("Add New Transaction")
 
@@ -87,11 +183,9 @@ def add_transaction_view(
 
     # Get categories based on transaction type (updates immediately when type changes)
     if transaction_type == "Expense":
-        categories = category_service.get_categories(TransactionType.EXPENSE)
+        category_names = utility.get_category_names(TransactionType.EXPENSE)
     else:
-        categories = category_service.get_categories(TransactionType.INCOME)
-
-    category_names = [cat.name for cat in categories] if categories else []
+        category_names = utility.get_category_names(TransactionType.INCOME)
 
     # All inputs OUTSIDE form for immediate reactivity
     col1, col2 = st.columns(2)
@@ -105,9 +199,8 @@ def add_transaction_view(
 
     with col2:
         # Get all accounts
-        accounts = account_service.get_all_accounts()
-        if accounts:
-            account_names = [acc.account_name for acc in accounts]
+        account_names = utility.get_account_names()
+        if account_names:
             account_name = st.selectbox("Account", account_names)
         else:
             st.warning("No accounts available. Please create an account first!")
@@ -133,13 +226,12 @@ def add_transaction_view(
         )
 
     # Add date and time inputs
+    now = datetime.now()
     col_date, col_time = st.columns(2)
     with col_date:
-        transaction_date = st.date_input("Transaction Date", value=datetime.now())
+        transaction_date = st.date_input("Transaction Date", value=now)
     with col_time:
-        transaction_time = st.time_input(
-            "Transaction Time", value=datetime.now().time()
-        )
+        transaction_time = st.time_input("Transaction Time", value=now.time())
 
     description = st.text_area("Description (Optional)", key="add_transaction_desc")
 
@@ -149,7 +241,7 @@ def add_transaction_view(
         amount_in_myr = format_amount(amount)
         if currency != "MYR":
             try:
-                exchange_rate = currency_service.get_exchange_rate(currency)
+                exchange_rate = get_cached_exchange_rate(currency)
                 amount_in_myr = format_amount(amount) * exchange_rate
             except Exception:
                 pass  # If conversion fails, use original amount
@@ -191,11 +283,11 @@ def add_transaction_view(
         submitted = st.form_submit_button("Add Transaction")
 
         if submitted:
-            if not accounts:
+            if not account_names:
                 utility.error_popup(
                     "Cannot add transaction without an account. Please create an account first."
                 )
-            elif not categories:
+            elif not category_names:
                 st.error(
                     f"Cannot add transaction without categories. Please create a {transaction_type.lower()} category first."
                 )
@@ -223,25 +315,22 @@ def add_transaction_view(
                         description=description if description else "",
                         custom_datetime=custom_datetime,
                     )
+                    utility.bump_transaction_version()
                     utility.success_popup("Transaction added successfully!")
 
                 except (InvalidInputError, NotFoundError) as e:
                     utility.error_popup(f"Error: {e}")
 
 
-def view_transactions_view(
-    transaction_service: TransactionService,
-    account_service: AccountService,
-    category_service: CategoryService,
-    currency_service: CurrencyService,
-):
+def view_transactions_view():
     """Tab for viewing all transactions with filters."""
 
     st.header("All Transactions")
 
-    transactions = transaction_service.get_all_transactions()
+    version = utility.get_transaction_version()
+    df_all, df_display = get_transaction_frames(version)
 
-    if transactions:
+    if not df_all.empty:
         # Add filter options
         col1, col2, col3 = st.columns(3)
 
@@ -249,77 +338,28 @@ def view_transactions_view(
             filter_type = st.selectbox("Filter by Type", ["All", "Expense", "Income"])
 
         with col2:
-            accounts = account_service.get_all_accounts()
-            account_names = ["All"] + [acc.account_name for acc in accounts]
+            account_names = ["All"] + utility.get_account_names()
             filter_account = st.selectbox("Filter by Account", account_names)
 
         with col3:
-            all_categories = category_service.get_all_categories()
-            category_options = ["All"] + [cat.name for cat in all_categories]
+            category_options = ["All"] + utility.get_category_names()
             filter_category = st.selectbox("Filter by Category", category_options)
 
-        # Apply filters
-        filtered_transactions = transactions
+        # Apply all filters as one combined boolean mask
+        mask = filter_mask(df_all, filter_type, filter_account, filter_category)
+        filtered_transactions = df_all[mask]
 
-        if filter_type != "All":
-            filter_type_enum = (
-                TransactionType.EXPENSE
-                if filter_type == "Expense"
-                else TransactionType.INCOME
-            )
-            filtered_transactions = [
-                t
-                for t in filtered_transactions
-                if t.transaction_type == filter_type_enum
-            ]
-
-        if filter_account != "All":
-            filtered_transactions = [
-                t
-                for t in filtered_transactions
-                if t.account.account_name == filter_account
-            ]
-
-        if filter_category != "All":
-            filtered_transactions = [
-                t for t in filtered_transactions if t.category.name == filter_category
-            ]
-
-        if filtered_transactions:
-
-            # Convert to DataFrame
-
-            transactions_data = []
-            for trans in filtered_transactions:
-                # Format amount with currency
-                currency_symbol = get_currency_symbol(trans.currency)
-                if trans.currency != "MYR":
-                    # Show original currency + locked MYR equivalent
-                    amount_display = f"{currency_symbol}{trans.amount:,.2f} ({trans.currency}) = RM {trans.amount_in_myr:,.2f}"
-                else:
-                    amount_display = f"{currency_symbol} {trans.amount:,.2f}"
-
-                transactions_data.append(
-                    {
-                        "ID": trans.id,
-                        "Date": trans.datetime.strftime("%Y-%m-%d %H:%M"),
-                        "Type": trans.transaction_type.value.capitalize(),
-                        "Category": trans.category.name,
-                        "Account": trans.account.account_name,
-                        "Amount": amount_display,
-                        "Description": (
-                            trans.description[:30] + "..."
-                            if len(trans.description) > 30
-                            else trans.description
-                        ),
-                    }
-                )
+        if not filtered_transactions.empty:
 
-            df = pd.DataFrame(transactions_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(df_display[mask], use_container_width=True, hide_index=True)
 
-            # Export button
-            csv = df.to_csv(index=False).encode("utf-8-sig")
+            # Export button (CSV is cached per transaction version and filters)
+            csv = get_transactions_csv(
+                version,
+                filter_type,
+                filter_account,
+                filter_category,
+            )
 
             # Generate filename with current filters
             filter_parts = []
@@ -348,15 +388,12 @@ def view_transactions_view(
 
             total_transactions = len(filtered_transactions)
 
-            # Use stored MYR amounts for accurate totals
-            total_expense = Decimal("0")
-            total_income = Decimal("0")
-
-            for t in filtered_transactions:
-                if t.transaction_type == TransactionType.EXPENSE:
-                    total_expense += t.amount_in_myr
-                else:
-                    total_income += t.amount_in_myr
+            # Sum stored MYR amounts per transaction type
+            totals = filtered_transactions.groupby("transaction_type", observed=True)[
+                "amount_in_myr"
+            ].sum()
+            total_expense = float(totals.get(TransactionType.EXPENSE, 0.0))
+            total_income = float(totals.get(TransactionType.INCOME, 0.0))
 
             col_a.metric("Total Transactions", total_transactions)
             col_b.metric("Total Expenses (MYR)", f"RM {total_expense:,.2f}")
@@ -369,23 +406,132 @@ def view_transactions_view(
         )
 
 
-def edit_transaction_view(
-    transaction_service: TransactionService,
-    account_service: AccountService,
-    category_service: CategoryService,
-):
+def filter_mask(
+    df_all: pd.DataFrame, filter_type: str, filter_account: str, filter_category: str
+) -> np.ndarray:
+    """Combined boolean mask for the type, account and category filters ("All" skips one)."""
+
+    mask = np.ones(len(df_all), dtype=bool)
+
+    if filter_type != "All":
+        filter_type_enum = (
+            TransactionType.EXPENSE
+            if filter_type == "Expense"
+            else TransactionType.INCOME
+        )
+        mask &= category_mask(df_all["transaction_type"], filter_type_enum)
+
+    if filter_account != "All":
+        mask &= category_mask(df_all["account_name"], filter_account)
+
+    if filter_category != "All":
+        mask &= category_mask(df_all["category_name"], filter_category)
+
+    return mask
+
+
+def build_display_frame(transactions: pd.DataFrame) -> pd.DataFrame:
+    """Build the formatted table shown (and exported) for a transactions frame."""
+
+    descriptions = transactions["description"]
+    currencies = transactions["currency"].astype(str)
+    symbols = currencies.map(CURRENCY_SYMBOLS).fillna(currencies)
+    amounts = transactions["amount"].map("{:,.2f}".format)
+    amounts_in_myr = transactions["amount_in_myr"].map("{:,.2f}".format)
+    return pd.DataFrame(
+        {
+            "ID": transactions["id"].values,
+            "Date": transactions["datetime"].dt.strftime("%Y-%m-%d %H:%M").values,
+            "Type": transactions["transaction_type"].cat.rename_categories(
+                lambda t: t.value.capitalize()
+            ),
+            "Category": transactions["category_name"].values,
+            "Account": transactions["account_name"].values,
+            "Amount": np.where(
+                (currencies != "MYR").values,
+                # Show original currency + locked MYR equivalent
+                symbols + amounts + " (" + currencies + ") = RM " + amounts_in_myr,
+                symbols + " " + amounts,
+            ),
+            "Description": descriptions.where(
+                descriptions.str.len() <= 30, descriptions.str.slice(0, 30) + "..."
+            ).values,
+        }
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_transactions_csv(
+    version: int, filter_type: str, filter_account: str, filter_category: str
+) -> bytes:
+    """Return the filtered transaction table as CSV bytes, cached per version and filters."""
+
+    df_all, df_display = get_transaction_frames(version)
+    mask = filter_mask(df_all, filter_type, filter_account, filter_category)
+    return df_display[mask].to_csv(index=False).encode("utf-8-sig")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_transaction_frames(version: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return the raw and formatted DataFrames for all transactions, cached per
+    version. Both share the same row order, so one filter mask applies to both.
+    """
+
+    df_all = build_transactions_frame(load_transactions(version))
+    return df_all, build_display_frame(df_all)
+
+
+def build_transactions_frame(transactions) -> pd.DataFrame:
+    """Build a DataFrame of transaction rows, filling each column in one pass."""
+
+    ids, datetimes, types, categories, accounts = [], [], [], [], []
+    amounts, currencies, amounts_in_myr, descriptions = [], [], [], []
+    for t in transactions:
+        ids.append(t.id)
+        datetimes.append(t.datetime)
+        types.append(t.transaction_type)
+        categories.append(t.category_name)
+        accounts.append(t.account_name)
+        amounts.append(t.amount)
+        currencies.append(t.currency)
+        amounts_in_myr.append(t.amount_in_myr)
+        descriptions.append(t.description)
+
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "datetime": pd.to_datetime(datetimes),
+            "transaction_type": pd.Categorical(types),
+            "category_name": pd.Categorical(categories),
+            "account_name": pd.Categorical(accounts),
+            "amount": amounts,
+            "currency": pd.Categorical(currencies),
+            "amount_in_myr": np.array(amounts_in_myr, dtype=np.float64),
+            "description": np.array(descriptions, dtype=object),
+        }
+    )
+
+
+def category_mask(column: pd.Series, value) -> np.ndarray:
+    """Boolean mask of rows in a categorical column equal to value."""
+
+    categories = column.cat.categories
+    if value not in categories:
+        return np.zeros(len(column), dtype=bool)
+    return column.cat.codes.values == categories.get_loc(value)
+
+
+def edit_transaction_view(transaction_service: TransactionService):
     """Tab for editing an existing transaction."""
 
     st.header("Edit Transaction")
 
-    transactions = transaction_service.get_all_transactions()
+    transactions = load_transactions(utility.get_transaction_version())
 
     if transactions:
         # Let user select transaction to edit
-        transaction_options = [
-            f"ID {t.id} - {t.datetime.strftime('%Y-%m-%d')} - {t.category.name} - {get_currency_symbol(t.currency)}{t.amount:,.2f}"
-            for t in transactions
-        ]
+        transaction_options = [t.label for t in transactions]
 
         selected_index = st.selectbox(
             "Select Transaction to Edit",
@@ -402,11 +548,13 @@ def edit_transaction_view(
         col1.write(
             f"**Type:** {selected_transaction.transaction_type.value.capitalize()}"
         )
-        col2.write(f"**Category:** {selected_transaction.category.name}")
-        col3.write(f"**Account:** {selected_transaction.account.account_name}")
+        col2.write(f"**Category:** {selected_transaction.category_name}")
+        col3.write(f"**Account:** {selected_transaction.account_name}")
 
         # Display amount with currency
-        currency_symbol = get_currency_symbol(selected_transaction.currency)
+        currency_symbol = CURRENCY_SYMBOLS.get(
+            selected_transaction.currency, selected_transaction.currency
+        )
         col1.write(
             f"**Amount:** {currency_symbol}{selected_transaction.amount:,.2f} ({selected_transaction.currency})"
         )
@@ -436,20 +584,17 @@ def edit_transaction_view(
                     else selected_transaction.transaction_type.value.capitalize()
                 )
                 if type_for_categories == "Expense":
-                    categories = category_service.get_categories(
-                        TransactionType.EXPENSE
-                    )
+                    categories = utility.get_category_names(TransactionType.EXPENSE)
                 else:
-                    categories = category_service.get_categories(TransactionType.INCOME)
+                    categories = utility.get_category_names(TransactionType.INCOME)
 
-                category_names = [""] + [cat.name for cat in categories]
+                category_names = [""] + categories
                 new_category = st.selectbox(
                     "New Category (optional)", options=category_names
                 )
 
             with col2:
-                accounts = account_service.get_all_accounts()
-                account_options = [""] + [acc.account_name for acc in accounts]
+                account_options = [""] + utility.get_account_names()
                 new_account = st.selectbox(
                     "New Account (optional)", options=account_options
                 )
@@ -508,6 +653,7 @@ def edit_transaction_view(
                         description=new_description,
                         custom_datetime=custom_datetime,
                     )
+                    utility.bump_transaction_version()
                     utility.success_popup(
                         f"Transaction ID {updated_transaction.id} updated successfully!"
                     )
@@ -523,15 +669,12 @@ def delete_transaction_view(transaction_service: TransactionService):
 
     st.header("Delete Transaction")
 
-    transactions = transaction_service.get_all_transactions()
+    transactions = load_transactions(utility.get_transaction_version())
 
     if transactions:
 
         # Let user select transaction to delete
-        transaction_options = [
-            f"ID {t.id} - {t.datetime.strftime('%Y-%m-%d')} - {t.category.name} - {get_currency_symbol(t.currency)}{t.amount:,.2f}"
-            for t in transactions
-        ]
+        transaction_options = [t.label for t in transactions]
         selected_index = st.selectbox(
             "Select Transaction to Delete",
             range(len(transactions)),
@@ -555,11 +698,13 @@ def delete_transaction_view(transaction_service: TransactionService):
             f"**Type:** {selected_transaction.transaction_type.value.capitalize()}"
         )
 
-        col1.write(f"**Category:** {selected_transaction.category.name}")
-        col2.write(f"**Account:** {selected_transaction.account.account_name}")
+        col1.write(f"**Category:** {selected_transaction.category_name}")
+        col2.write(f"**Account:** {selected_transaction.account_name}")
 
         # Display amount with currency
-        currency_symbol = get_currency_symbol(selected_transaction.currency)
+        currency_symbol = CURRENCY_SYMBOLS.get(
+            selected_transaction.currency, selected_transaction.currency
+        )
         col3.write(
             f"**Amount:** {currency_symbol}{selected_transaction.amount:,.2f} ({selected_transaction.currency})"
         )
@@ -579,10 +724,10 @@ def delete_transaction_view(transaction_service: TransactionService):
                 else:
                     try:
                         transaction_service.delete_transaction(selected_transaction.id)
+                        utility.bump_transaction_version()
                         utility.success_popup(
                             f"Transaction ID {selected_transaction.id} deleted successfully!"
                         )
-                        st.rerun()
                     except NotFoundError as e:
                         utility.error_popup(f"Error: {e}")
     else:
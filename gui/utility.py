@@ -1,37 +1,94 @@
 # gui/utility.py
 
+import itertools
+
 import streamlit as st
-import time
 
+from app.database.base import SessionLocal
+from app.database.models import TransactionType
+from app.services.account_service import AccountService
+from app.services.category_service import CategoryService
+from app.services.currency_service import CurrencyService
+
+
+@st.cache_data(ttl=60)
+def get_account_names() -> list[str]:
+    """
+    Return all account names, cached across reruns.
+
+    Call get_account_names.clear() after creating, renaming or deleting an
+    account so the next call reloads from the database.
+    """
+    db_session = SessionLocal()
+    try:
+        account_service = AccountService(db_session, CurrencyService(db_session))
+        return [acc.account_name for acc in account_service.get_all_accounts()]
+    finally:
+        db_session.close()
+
+
+@st.cache_data(ttl=60)
+def get_category_names(transaction_type: TransactionType | None = None) -> list[str]:
+    """
+    Return category names, optionally for one transaction type, cached across reruns.
+
+    Call get_category_names.clear() after creating, renaming or deleting a
+    category so the next call reloads from the database.
+    """
+    db_session = SessionLocal()
+    try:
+        category_service = CategoryService(db_session)
+        if transaction_type is None:
+            categories = category_service.get_all_categories()
+        else:
+            categories = category_service.get_categories(transaction_type)
+        return [cat.name for cat in categories]
+    finally:
+        db_session.close()
+
+
+# st.cache_data is shared by every browser session, so the version keying the
+# cached transaction lists is process-wide rather than kept in session_state
+_transaction_versions = itertools.count(1)
+_transaction_version = 0
 
-@st.dialog("Message")
+
+def get_transaction_version() -> int:
+    """Return the current cache key for transaction lists."""
+    return _transaction_version
+
+
+def bump_transaction_version():
+    """
+    Invalidate cached transaction lists for every session.
+
+    Call after anything that changes stored transactions or the account and
+    category names they display.
+    """
+    global _transaction_version
+    # next() on a count is atomic, so concurrent bumps never reuse a version
+    _transaction_version = next(_transaction_versions)
+
+
+@st.dialog("Message", on_dismiss="rerun")
 def success_popup(message: str):
     st.success(message)
 
     if st.button("Okay"):
         st.rerun()
 
-    time.sleep(1.5)
-    st.rerun()
-
 
-@st.dialog("Message")
+@st.dialog("Message", on_dismiss="rerun")
 def error_popup(message: str):
     st.error(message)
 
     if st.button("Okay"):
         st.rerun()
 
-    time.sleep(1.5)
-    st.rerun()
 
-
-@st.dialog("Message")
+@st.dialog("Message", on_dismiss="rerun")
 def warning_popup(message: str):
     st.warning(message)
 
     if st.button("Okay"):
         st.rerun()
-
-    time.sleep(1.5)
-    st.rerun()
@@ -1,23 +1,31 @@
 # main.py
 
 import logging
+from logging.handlers import RotatingFileHandler
 
 from gui.start import launch
 
 
 def init_logger(log_file="log/app.log"):
-    """Configures the logger to write to a file."""
+    """Configures the logger to write to a size-capped, rotating file."""
+
+    root_logger = logging.getLogger()
+
+    # Streamlit re-executes this script on every rerun; configure only once
+    if any(isinstance(h, RotatingFileHandler) for h in root_logger.handlers):
+        return
 
     log_format = "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s"
     date_format = "%d-%m-%Y %H:%M:%S"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        datefmt=date_format,
-        filename=log_file,
-        filemode="a",
+    # Keep at most 5 MB of current log plus 3 backups
+    handler = RotatingFileHandler(
+        log_file, mode="a", maxBytes=5 * 1024 * 1024, backupCount=3
     )
+    handler.setFormatter(logging.Formatter(log_format, date_format))
+
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(handler)
 
 
 def main():
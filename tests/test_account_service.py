@@ -1,81 +1,166 @@
 # tests/test_account_service.py
 
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from app.database.models import Account
+import app.services.account_service as account_service_module
 from app.exception import AlreadyExistsError, InvalidInputError, NotFoundError
 from app.services.account_service import AccountService
+from app.services.currency_service import CurrencyService
 
+# Shared Decimal values, parsed once at import rather than per use
+_D0 = Decimal("0.00")
+_D10 = Decimal("10.00")
+_D1000 = Decimal("1000.00")
+_D4500 = Decimal("4500.00")
 
-@pytest.fixture
+
+def cents(amount):
+    """Return a two-decimal amount as whole cents for integer comparison."""
+    scaled = amount * 100
+    # Sub-cent digits mean the service skipped its rounding step
+    assert scaled == scaled.to_integral_value(), f"{amount} is not whole cents"
+    return int(scaled)
+
+
+def expect(exc, fn, *args, **kwargs):
+    """Assert that fn(*args, **kwargs) raises exc, without pytest.raises' ExceptionInfo."""
+    try:
+        fn(*args, **kwargs)
+    except exc:
+        return
+    raise AssertionError(f"expected {exc.__name__}")
+
+
+def make_account(name, balance, id=None):
+    """Build a duck-typed account row; the service only reads its attributes."""
+    return SimpleNamespace(account_name=name, balance=balance, id=id)
+
+
+class FakeQuery:
+    """Minimal query stand-in returning the results seeded on its FakeSession."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def first(self):
+        # Queued results serve successive first() calls, e.g. old then new name lookup
+        if self.session.first_results:
+            return self.session.first_results.pop(0)
+        return self.session.first_result
+
+    def all(self):
+        return self.session.all_result
+
+
+class FakeSession:
+    """Hand-rolled database session that records calls without MagicMock overhead."""
+
+    def __init__(self):
+        # One query object is reused for every query() call
+        self._query = FakeQuery(self)
+        self.reset()
+
+    def reset(self):
+        self.first_result = None
+        self.first_results = []
+        self.all_result = []
+        self.add_calls = []
+        self.delete_calls = []
+        self.commit_count = 0
+        self.rollback_count = 0
+
+    def query(self, model):
+        return self._query
+
+    def add(self, obj):
+        self.add_calls.append(obj)
+
+    def delete(self, obj):
+        self.delete_calls.append(obj)
+
+    def commit(self):
+        self.commit_count += 1
+
+    def rollback(self):
+        self.rollback_count += 1
+
+
+@pytest.fixture(scope="module")
 def mock_db_session():
-    return MagicMock()
+    return FakeSession()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_currency_service():
     """Mock currency service for testing."""
-    mock = MagicMock()
-    # Default: 1:1 conversion (no conversion needed)
-    mock.convert_to_myr = MagicMock(side_effect=lambda amount, currency: amount)
-    return mock
+    # spec keeps the mock to CurrencyService's real attributes
+    return Mock(spec=CurrencyService)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def account_service(mock_db_session, mock_currency_service):
+    """One AccountService shared by every test in this module."""
     return AccountService(mock_db_session, mock_currency_service)
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(account_service, mock_db_session, mock_currency_service):
+    """Give every test a clean view of the shared module-scoped mocks."""
+    mock_db_session.reset()
+    # The service is shared too, so undo any test that swapped its collaborators
+    account_service.db_session = mock_db_session
+    account_service.currency_service = mock_currency_service
+    mock_currency_service.reset_mock(return_value=True, side_effect=True)
+    # MYR accounts never convert; the foreign-currency test sets its own result
+    mock_currency_service.convert_to_myr.return_value = _D0
+
+
 class TestAddAccount:
 
-    @pytest.mark.parametrize(
-        "name,balance,expected_name,expected_balance",
-        [
-            ("Savings", "100.00", "Savings", Decimal("100.00")),  # Normal case
-            ("Zero Balance", "0", "Zero balance", Decimal("0.00")),  # Zero balance
+    def test_add_account_success(self, account_service, mock_db_session):
+        cases = [
+            ("Savings", "100.00", "Savings", 10000),  # Normal case
+            ("Zero Balance", "0", "Zero balance", 0),  # Zero balance
             (
                 "Test Account",
                 "100.1234   ",
                 "Test account",
-                Decimal("100.12"),
+                10012,
             ),  # Rounded to 2 decimals and can trip space
             (
                 "  mixed case  ",
                 "10",
                 "Mixed case",
-                Decimal("10.00"),
+                1000,
             ),  # Trim and capitalize
             (
                 "Big Balance",
                 "999999999999.99",
                 "Big balance",
-                Decimal("999999999999.99"),
+                99999999999999,
             ),  # Big number
-        ],
-    )
-    def test_add_account_success(
-        self,
-        account_service,
-        mock_db_session,
-        name,
-        balance,
-        expected_name,
-        expected_balance,
-    ):
-        # No existing account
-        mock_db_session.query().filter_by().first.return_value = None
-        mock_db_session.add.return_value = None
-        mock_db_session.commit.return_value = None
+        ]
 
-        account = account_service.add_account(name, balance)
+        for name, balance, expected_name, expected_cents in cases:
+            mock_db_session.reset()
+            # No existing account
+            mock_db_session.first_result = None
 
-        assert account.account_name == expected_name
-        assert account.balance == expected_balance
-        mock_db_session.add.assert_called_once_with(account)
-        mock_db_session.commit.assert_called_once()
+            account = account_service.add_account(name, balance)
+
+            # Check the row actually handed to the session
+            (added,) = mock_db_session.add_calls
+            assert added is account
+            assert added.account_name == expected_name
+            assert cents(added.balance) == expected_cents
+            assert mock_db_session.commit_count == 1
 
     @pytest.mark.parametrize(
         "name,balance,expected_exception",
@@ -88,134 +173,124 @@ class TestAddAccount:
     def test_add_account_invalid_input_raises(
         self, account_service, name, balance, expected_exception
     ):
-        with pytest.raises(expected_exception):
-            account_service.add_account(name, balance)
+        expect(expected_exception, account_service.add_account, name, balance)
 
-    def test_add_account_non_numeric_balance_raises(self, account_service):
-        with patch(
-            "app.services.account_service.validate_non_negative_amount",
-            side_effect=InvalidInputError,
-        ):
-            with pytest.raises(InvalidInputError):
-                account_service.add_account("Test", "abc")
+    def test_add_account_non_numeric_balance_raises(self, account_service, monkeypatch):
+        monkeypatch.setattr(
+            account_service_module,
+            "validate_non_negative_amount",
+            MagicMock(side_effect=InvalidInputError),
+        )
+        expect(InvalidInputError, account_service.add_account, "Test", "abc")
 
     def test_add_account_duplicate_name_raises(self, account_service, mock_db_session):
-        existing_account = Account(account_name="Test account", balance=Decimal("0.00"))
-        mock_db_session.query().filter_by().first.return_value = existing_account
+        existing_account = make_account("Test account", _D0)
+        mock_db_session.first_result = existing_account
 
-        with pytest.raises(AlreadyExistsError):
-            account_service.add_account("Test account", "10")
+        expect(AlreadyExistsError, account_service.add_account, "Test account", "10")
 
     def test_add_account_with_foreign_currency(
         self, account_service, mock_db_session, mock_currency_service
     ):
         """Test adding account with foreign currency converts to MYR."""
         # No existing account
-        mock_db_session.query().filter_by().first.return_value = None
+        mock_db_session.first_result = None
 
         # Mock USD to MYR conversion: $1000 USD = RM 4500
-        mock_currency_service.convert_to_myr = MagicMock(
-            return_value=Decimal("4500.00")
-        )
+        mock_currency_service.convert_to_myr.return_value = _D4500
 
         account = account_service.add_account("USD Wallet", "1000.00", currency="USD")
 
         assert account.account_name == "Usd wallet"
-        assert account.balance == Decimal("4500.00")  # Converted to MYR
+        assert cents(account.balance) == 450000  # Converted to MYR
 
         # Verify conversion was called
-        mock_currency_service.convert_to_myr.assert_called_once_with(
-            Decimal("1000.00"), "USD"
-        )
-        mock_db_session.add.assert_called_once_with(account)
-        mock_db_session.commit.assert_called_once()
+        convert = mock_currency_service.convert_to_myr
+        assert convert.call_count == 1
+        assert convert.call_args.args == (_D1000, "USD")
+        assert mock_db_session.add_calls == [account]
+        assert mock_db_session.commit_count == 1
 
     def test_add_account_with_myr_currency_no_conversion(
         self, account_service, mock_db_session, mock_currency_service
     ):
         """Test adding account with MYR doesn't trigger conversion."""
         # No existing account
-        mock_db_session.query().filter_by().first.return_value = None
+        mock_db_session.first_result = None
 
         account = account_service.add_account("MYR Account", "1000.00", currency="MYR")
 
         assert account.account_name == "Myr account"
-        assert account.balance == Decimal("1000.00")
+        assert cents(account.balance) == 100000
 
         # Verify conversion was NOT called (MYR to MYR)
-        mock_currency_service.convert_to_myr.assert_not_called()
-        mock_db_session.add.assert_called_once_with(account)
-        mock_db_session.commit.assert_called_once()
+        assert mock_currency_service.convert_to_myr.call_count == 0
+        assert mock_db_session.add_calls == [account]
+        assert mock_db_session.commit_count == 1
 
 
 class TestGetAccount:
 
-    @pytest.mark.parametrize(
-        "input_name",
-        [
+    def test_get_existing_account(self, account_service, mock_db_session):
+        existing = make_account("Test account", Decimal("50"))
+        mock_db_session.first_result = existing
+
+        # One seeded result serves every lookup, so no reset between names
+        for input_name in (
             "Test account",  # Exact match
             "  Test account  ",  # With spaces
             "tEsT aCcOuNt",  # Different case
-        ],
-    )
-    def test_get_existing_account(self, account_service, mock_db_session, input_name):
-        existing = Account(account_name="Test account", balance=Decimal("50"))
-        mock_db_session.query().filter_by().first.return_value = existing
-        account = account_service.get_account(input_name)
-        assert account == existing
+        ):
+            assert account_service.get_account(input_name) is existing
 
     def test_get_non_existing_account_returns_none(
         self, account_service, mock_db_session
     ):
-        mock_db_session.query().filter_by().first.return_value = None
+        mock_db_session.first_result = None
         account = account_service.get_account("Nonexistent")
         assert account is None
 
     def test_get_account_empty_name_raises(self, account_service):
-        with pytest.raises(InvalidInputError):
-            account_service.get_account("")
+        expect(InvalidInputError, account_service.get_account, "")
 
-        with pytest.raises(InvalidInputError):
-            account_service.get_account("   ")
+        expect(InvalidInputError, account_service.get_account, "   ")
 
 
 class TestGetAllAccounts:
 
     def test_get_all_accounts(self, account_service, mock_db_session):
         accounts = [
-            Account(account_name="A", balance=Decimal("1")),
-            Account(account_name="B", balance=Decimal("2")),
+            make_account("A", Decimal("1")),
+            make_account("B", Decimal("2")),
         ]
-        mock_db_session.query().all.return_value = accounts
+        mock_db_session.all_result = accounts
         result = account_service.get_all_accounts()
         assert result == accounts
 
-    def test_get_all_accounts_empty(self, account_service, mock_db_session):
-        mock_db_session.query().all.return_value = []
+        # Empty table
+        mock_db_session.all_result = []
         result = account_service.get_all_accounts()
         assert result == []
 
 
 class TestEditAccountName:
 
-    @pytest.mark.parametrize(
-        "old_name,new_name,expected_name",
-        [
+    def test_rename_account_success(self, account_service, mock_db_session):
+        cases = [
             ("Old Name", "New Name", "New name"),  # Rename success
             ("Same Name", "Same name", "Same name"),  # Same name no error
-        ],
-    )
-    def test_rename_account_success(
-        self, account_service, mock_db_session, old_name, new_name, expected_name
-    ):
-        account = Account(account_name=old_name, balance=Decimal("10"))
-        # old exists, new either doesn't exist or is the same account
-        mock_db_session.query().filter_by().first.side_effect = [
-            account,
-            None if old_name != new_name else account,
         ]
-        updated = account_service.edit_account_name(old_name, new_name)
-        assert updated.account_name == expected_name
+
+        for old_name, new_name, expected_name in cases:
+            mock_db_session.reset()
+            account = make_account(old_name, _D10)
+            # old exists, new either doesn't exist or is the same account
+            mock_db_session.first_results = [
+                account,
+                None if old_name != new_name else account,
+            ]
+            updated = account_service.edit_account_name(old_name, new_name)
+            assert updated.account_name == expected_name
 
     @pytest.mark.parametrize(
         "old_name,new_name,expected_exception",
@@ -227,54 +302,49 @@ class TestEditAccountName:
     def test_rename_invalid_input_raises(
         self, account_service, old_name, new_name, expected_exception
     ):
-        with pytest.raises(expected_exception):
-            account_service.edit_account_name(old_name, new_name)
+        expect(
+            expected_exception, account_service.edit_account_name, old_name, new_name
+        )
 
     def test_rename_non_existing_old_account_raises(
         self, account_service, mock_db_session
     ):
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(NotFoundError):
-            account_service.edit_account_name("DoesNotExist", "NewName")
+        mock_db_session.first_result = None
+        expect(
+            NotFoundError, account_service.edit_account_name, "DoesNotExist", "NewName"
+        )
 
     def test_rename_to_existing_name_raises(self, account_service, mock_db_session):
-        old_account = Account(account_name="Old", balance=Decimal("10"))
-        old_account.id = 1
-        new_account = Account(account_name="New", balance=Decimal("20"))
-        new_account.id = 2
-        mock_db_session.query().filter_by().first.side_effect = [
+        old_account = make_account("Old", _D10, id=1)
+        new_account = make_account("New", Decimal("20"), id=2)
+        mock_db_session.first_results = [
             old_account,
             new_account,
         ]
 
-        with pytest.raises(AlreadyExistsError):
-            account_service.edit_account_name("Old", "New")
+        expect(AlreadyExistsError, account_service.edit_account_name, "Old", "New")
 
 
 class TestDeleteAccount:
 
-    @pytest.mark.parametrize(
-        "input_name,stored_name",
-        [
+    def test_delete_existing_account(self, account_service, mock_db_session):
+        cases = [
             ("ToDelete", "ToDelete"),  # Exact match
             ("  DeleteMe  ", "DeleteMe"),  # With spaces
-        ],
-    )
-    def test_delete_existing_account(
-        self, account_service, mock_db_session, input_name, stored_name
-    ):
-        account = Account(account_name=stored_name, balance=Decimal("10"))
-        mock_db_session.query().filter_by().first.return_value = account
-        result = account_service.delete_account(input_name)
-        assert result is True
-        mock_db_session.delete.assert_called_once_with(account)
-        mock_db_session.commit.assert_called_once()
+        ]
+
+        for input_name, stored_name in cases:
+            mock_db_session.reset()
+            account = make_account(stored_name, _D10)
+            mock_db_session.first_result = account
+            result = account_service.delete_account(input_name)
+            assert result is True
+            assert mock_db_session.delete_calls == [account]
+            assert mock_db_session.commit_count == 1
 
     def test_delete_non_existing_account_raises(self, account_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(NotFoundError):
-            account_service.delete_account("Nonexistent")
+        mock_db_session.first_result = None
+        expect(NotFoundError, account_service.delete_account, "Nonexistent")
 
-    def test_delete_empty_name_raises(self, account_service):
-        with pytest.raises(InvalidInputError):
-            account_service.delete_account("")
+        # Empty name
+        expect(InvalidInputError, account_service.delete_account, "")
@@ -1,8 +1,11 @@
 # tests/test_budget_service.py
 
+import re
+from collections import namedtuple
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, call
 
 import pytest
 
@@ -10,15 +13,55 @@ from app.database.models import Budget, BudgetPeriod, TransactionType
 from app.exception import AlreadyExistsError, InvalidInputError, NotFoundError
 from app.services.budget_service import BudgetService
 
+# Shared immutable literals, built once rather than per test case
+LIM100 = Decimal("100")
+LIM150 = Decimal("150")
+LIM200 = Decimal("200")
+NOW_2024_06_10 = datetime(2024, 6, 10, 8, 0, 0)
+_EXCEEDED_RE = re.compile(r"budget exceeded", re.IGNORECASE)
 
-@pytest.fixture
+_BASE_BUDGET_KWARGS = dict(
+    category_id=1, limit_amount=LIM100, period=BudgetPeriod.MONTHLY
+)
+
+
+def make_budget(**overrides):
+    """Build a Budget from the shared defaults, overriding only what differs."""
+    return Budget(**{**_BASE_BUDGET_KWARGS, **overrides})
+
+
+# Plain data stand-in for a Category row; MagicMock(name=...) would not set .name
+Cat = namedtuple("Cat", "id type name", defaults=(1, TransactionType.EXPENSE, "Food"))
+
+
+@pytest.fixture(scope="session")
 def mock_db_session():
-    return MagicMock()
+    return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_category_service():
-    return MagicMock()
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_db_session, mock_category_service):
+    """Reset the session-shared mocks before each test."""
+    # One instance is reset rather than handing each test a copy.copy, which
+    # would share the child mocks; this drops stubbed results and side effects
+    for mock in (mock_db_session, mock_category_service):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+def _stub_first(session, value):
+    # Walk the stub chain through return_value so no query() calls get recorded
+    session.query.return_value.filter_by.return_value.first.return_value = value
+
+
+@pytest.fixture
+def stub_first(mock_db_session):
+    """Return a setter for the session's query().filter_by().first() result."""
+    return lambda value: _stub_first(mock_db_session, value)
 
 
 @pytest.fixture
@@ -26,34 +69,52 @@ def budget_service(mock_db_session, mock_category_service):
     return BudgetService(mock_db_session, mock_category_service)
 
 
+@pytest.fixture(scope="class")
+def class_budget_service(mock_db_session, mock_category_service):
+    """One BudgetService per class for tests that only stub and read."""
+    return BudgetService(mock_db_session, mock_category_service)
+
+
+def _apply_setup(setup, budget_service, mock_db_session, mock_category_service):
+    """Stub the collaborators for one of the named error-path scenarios."""
+    get_category = mock_category_service.get_category_by_name_and_type
+    if setup == "no_cat":
+        get_category.return_value = None
+        return
+    if setup is None:
+        return
+
+    # Every other scenario has a valid expense category
+    get_category.return_value = Cat()
+    if setup == "dup":
+        budget_service.get_category_budget = lambda *a, **k: object()
+    elif setup == "budget":
+        _stub_first(mock_db_session, make_budget())
+    elif setup == "no_budget":
+        _stub_first(mock_db_session, None)
+
+
 class TestGetBudget:
 
-    def test_get_budget_exists(self, budget_service, mock_db_session):
-        budget = Budget(
-            id=1,
-            category_id=1,
-            limit_amount=Decimal("100"),
-            period=BudgetPeriod.MONTHLY,
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-        assert budget_service.get_budget(1) == budget
+    def test_get_budget_exists(self, class_budget_service, stub_first):
+        budget = make_budget(id=1)
+        stub_first(budget)
+        assert class_budget_service.get_budget(1) == budget
 
-    def test_get_budget_not_exists(self, budget_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = None
-        assert budget_service.get_budget(999) is None
+    def test_get_budget_not_exists(self, class_budget_service, stub_first):
+        stub_first(None)
+        assert class_budget_service.get_budget(999) is None
 
 
 class TestGetCategoryBudget:
 
     def test_returns_budget_for_valid_category(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, stub_first, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1, limit_amount=Decimal("100"), period=BudgetPeriod.MONTHLY
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
+        budget = make_budget()
+        stub_first(budget)
         assert budget_service.get_category_budget("Food", "expense") == budget
 
     def test_category_not_found_raises(self, budget_service, mock_category_service):
@@ -66,72 +127,65 @@ class TestGetCategoryBudget:
             budget_service.get_category_budget("Food", "income")
 
     def test_category_exists_but_no_budget_returns_none(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, stub_first, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
-        mock_db_session.query().filter_by().first.return_value = None
+        stub_first(None)
         assert budget_service.get_category_budget("Food", "expense") is None
 
 
 class TestGetAllBudgets:
 
-    def test_returns_all_budgets(self, budget_service, mock_db_session):
+    def test_returns_all_budgets(self, class_budget_service, mock_db_session):
         budgets = [
-            Budget(
-                id=1,
-                category_id=1,
-                limit_amount=Decimal("100"),
-                period=BudgetPeriod.MONTHLY,
-            ),
-            Budget(
-                id=2,
-                category_id=2,
-                limit_amount=Decimal("200"),
-                period=BudgetPeriod.WEEKLY,
+            make_budget(id=1),
+            make_budget(
+                id=2, category_id=2, limit_amount=LIM200, period=BudgetPeriod.WEEKLY
             ),
         ]
         mock_db_session.query().all.return_value = budgets
-        assert budget_service.get_all_budgets() == budgets
+        assert class_budget_service.get_all_budgets() == budgets
 
-    def test_returns_empty_list_if_no_budgets(self, budget_service, mock_db_session):
+    def test_returns_empty_list_if_no_budgets(
+        self, class_budget_service, mock_db_session
+    ):
         mock_db_session.query().all.return_value = []
-        assert budget_service.get_all_budgets() == []
+        assert class_budget_service.get_all_budgets() == []
 
 
 class TestAddBudget:
 
     def test_add_budget_success_sets_defaults(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, mock_db_session, mock_category_service, monkeypatch
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
         # Ensure no existing budget
-        budget_service.get_category_budget = MagicMock(return_value=None)
-
-        fixed_now = datetime(2024, 6, 10, 8, 0, 0)
-        with patch(
-            "app.services.budget_service.get_current_time", return_value=fixed_now
-        ):
-            budget = budget_service.add_budget(
-                category_name="Food",
-                transaction_type_input="expense",
-                limit_amount="100",
-                period="monthly",
-            )
-
-        assert budget.limit_amount == Decimal("100")
+        budget_service.get_category_budget = lambda *a, **k: None
+
+        fixed_now = NOW_2024_06_10
+        monkeypatch.setattr(
+            "app.services.budget_service.get_current_time", lambda: fixed_now
+        )
+        budget = budget_service.add_budget(
+            category_name="Food",
+            transaction_type_input="expense",
+            limit_amount="100",
+            period="monthly",
+        )
+
+        assert budget.limit_amount == LIM100
         assert budget.period == BudgetPeriod.MONTHLY
         assert budget.start_date == fixed_now
-        mock_db_session.add.assert_called_once_with(budget)
-        mock_db_session.commit.assert_called_once()
+        assert mock_db_session.method_calls == [call.add(budget), call.commit()]
 
     def test_add_budget_with_future_start_date(
         self, budget_service, mock_db_session, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
-        budget_service.get_category_budget = MagicMock(return_value=None)
+        budget_service.get_category_budget = lambda *a, **k: None
 
         future_date = datetime(2025, 1, 1, 0, 0, 0)
         result = budget_service.add_budget(
@@ -145,77 +199,52 @@ class TestAddBudget:
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
 
-    def test_add_budget_invalid_category_raises(
-        self, budget_service, mock_category_service
-    ):
-        mock_category_service.get_category_by_name_and_type.return_value = None
-        with pytest.raises(NotFoundError):
-            budget_service.add_budget("Unknown", "expense", "100", "monthly")
-
-    def test_add_budget_non_expense_type_raises(self, budget_service):
-        with pytest.raises(InvalidInputError):
-            budget_service.add_budget("Food", "income", "100", "monthly")
-
-    def test_add_budget_negative_limit_raises(
-        self, budget_service, mock_category_service
-    ):
-        mock_category_service.get_category_by_name_and_type.return_value = MagicMock(
-            id=1
-        )
-        with pytest.raises(InvalidInputError):
-            budget_service.add_budget("Food", "expense", "-100", "monthly")
-
-    def test_add_budget_invalid_period_raises(
-        self, budget_service, mock_category_service
-    ):
-        mock_category_service.get_category_by_name_and_type.return_value = MagicMock(
-            id=1
-        )
-        with pytest.raises(InvalidInputError):
-            budget_service.add_budget("Food", "expense", "100", "invalid_period")
-
-    def test_add_budget_duplicate_budget_raises(
-        self, budget_service, mock_category_service
+    @pytest.mark.parametrize(
+        "args,exc,setup",
+        [
+            (("Unknown", "expense", "100", "monthly"), NotFoundError, "no_cat"),
+            (("Food", "income", "100", "monthly"), InvalidInputError, None),
+            (("Food", "expense", "-100", "monthly"), InvalidInputError, "cat_ok"),
+            (
+                ("Food", "expense", "100", "invalid_period"),
+                InvalidInputError,
+                "cat_ok",
+            ),
+            (("Food", "expense", "100", "monthly"), AlreadyExistsError, "dup"),
+        ],
+    )
+    def test_add_budget_invalid_raises(
+        self, budget_service, mock_db_session, mock_category_service, args, exc, setup
     ):
-        mock_category_service.get_category_by_name_and_type.return_value = MagicMock(
-            id=1
-        )
-        budget_service.get_category_budget = MagicMock(return_value=MagicMock())
-        with pytest.raises(AlreadyExistsError):
-            budget_service.add_budget("Food", "expense", "100", "monthly")
+        _apply_setup(setup, budget_service, mock_db_session, mock_category_service)
+        with pytest.raises(exc):
+            budget_service.add_budget(*args)
 
 
 class TestEditBudget:
 
     def test_edit_budget_success_updates_fields(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, mock_db_session, stub_first, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1, limit_amount=Decimal("100"), period=BudgetPeriod.MONTHLY
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
+        budget = make_budget()
+        stub_first(budget)
 
         updated = budget_service.edit_budget(
             "Food", "expense", new_limit_amount="150", new_period="yearly"
         )
-        assert updated.limit_amount == Decimal("150")
+        assert updated.limit_amount == LIM150
         assert updated.period == BudgetPeriod.YEARLY
         mock_db_session.commit.assert_called_once()
 
     def test_edit_budget_updates_start_date_future_ok(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, mock_db_session, stub_first, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1,
-            limit_amount=Decimal("100"),
-            period=BudgetPeriod.MONTHLY,
-            start_date=datetime(2024, 6, 1),
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
+        budget = make_budget(start_date=datetime(2024, 6, 1))
+        stub_first(budget)
 
         future_date = datetime(2024, 7, 1)
         result = budget_service.edit_budget(
@@ -224,45 +253,27 @@ class TestEditBudget:
         assert result.start_date == future_date
         mock_db_session.commit.assert_called_once()
 
-    def test_edit_budget_invalid_limit_raises(
-        self, budget_service, mock_db_session, mock_category_service
+    @pytest.mark.parametrize(
+        "kwargs,exc,setup",
+        [
+            ({"new_limit_amount": "-5"}, InvalidInputError, "budget"),
+            ({"new_period": "invalid_period"}, InvalidInputError, "budget"),
+            ({"new_limit_amount": "50"}, NotFoundError, "no_cat"),
+            ({"new_limit_amount": "50"}, NotFoundError, "no_budget"),
+        ],
+    )
+    def test_edit_budget_invalid_raises(
+        self,
+        budget_service,
+        mock_db_session,
+        mock_category_service,
+        kwargs,
+        exc,
+        setup,
     ):
-        category = MagicMock(id=1)
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1, limit_amount=Decimal("100"), period=BudgetPeriod.MONTHLY
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-        with pytest.raises(InvalidInputError):
-            budget_service.edit_budget("Food", "expense", new_limit_amount="-5")
-
-    def test_edit_budget_invalid_period_raises(
-        self, budget_service, mock_db_session, mock_category_service
-    ):
-        category = MagicMock(id=1)
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1, limit_amount=Decimal("100"), period=BudgetPeriod.MONTHLY
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-        with pytest.raises(InvalidInputError):
-            budget_service.edit_budget("Food", "expense", new_period="invalid_period")
-
-    def test_edit_budget_category_not_found_raises(
-        self, budget_service, mock_category_service
-    ):
-        mock_category_service.get_category_by_name_and_type.return_value = None
-        with pytest.raises(NotFoundError):
-            budget_service.edit_budget("Food", "expense", new_limit_amount="50")
-
-    def test_edit_budget_budget_not_found_raises(
-        self, budget_service, mock_db_session, mock_category_service
-    ):
-        category = MagicMock(id=1)
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(NotFoundError):
-            budget_service.edit_budget("Food", "expense", new_limit_amount="50")
+        _apply_setup(setup, budget_service, mock_db_session, mock_category_service)
+        with pytest.raises(exc):
+            budget_service.edit_budget("Food", "expense", **kwargs)
 
     def test_edit_budget_non_expense_raises(self, budget_service):
         with pytest.raises(InvalidInputError):
@@ -272,178 +283,211 @@ class TestEditBudget:
 class TestDeleteBudget:
 
     def test_delete_budget_success(
-        self, budget_service, mock_db_session, mock_category_service
+        self, budget_service, mock_db_session, stub_first, mock_category_service
     ):
-        category = MagicMock(id=1)
+        category = Cat()
         mock_category_service.get_category_by_name_and_type.return_value = category
         budget = MagicMock()
-        mock_db_session.query().filter_by().first.return_value = budget
+        stub_first(budget)
         assert budget_service.delete_budget("Food", "expense") is True
         mock_db_session.delete.assert_called_once_with(budget)
         mock_db_session.commit.assert_called_once()
 
-    def test_delete_budget_not_found_raises(
-        self, budget_service, mock_db_session, mock_category_service
+    @pytest.mark.parametrize(
+        "transaction_type,exc,setup",
+        [
+            ("expense", NotFoundError, "no_budget"),
+            ("income", InvalidInputError, None),
+            ("expense", NotFoundError, "no_cat"),
+        ],
+    )
+    def test_delete_budget_invalid_raises(
+        self,
+        budget_service,
+        mock_db_session,
+        mock_category_service,
+        transaction_type,
+        exc,
+        setup,
     ):
-        category = MagicMock(id=1)
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(NotFoundError):
-            budget_service.delete_budget("Food", "expense")
-
-    def test_delete_budget_non_expense_type_raises(self, budget_service):
-        with pytest.raises(InvalidInputError):
-            budget_service.delete_budget("Food", "income")
-
-    def test_delete_budget_category_not_found_raises(
-        self, budget_service, mock_category_service
-    ):
-        mock_category_service.get_category_by_name_and_type.return_value = None
-        with pytest.raises(NotFoundError):
-            budget_service.delete_budget("Food", "expense")
+        _apply_setup(setup, budget_service, mock_db_session, mock_category_service)
+        with pytest.raises(exc):
+            budget_service.delete_budget("Food", transaction_type)
+
+
+def _run_status(
+    budget_service,
+    mock_db_session,
+    mock_category_service,
+    monkeypatch,
+    benchmark,
+    period,
+    start_date,
+    now=None,
+    txns=(),
+):
+    """Stub a category budget with the given period and return its benchmarked status."""
+    category = Cat()
+    mock_category_service.get_category_by_name_and_type.return_value = category
+    budget = make_budget(period=period, start_date=start_date)
+    _stub_first(mock_db_session, budget)
+    mock_db_session.query().filter().all.return_value = list(txns)
+
+    # Leave the real clock in place when no fixed time is given
+    if now is not None:
+        monkeypatch.setattr("app.services.budget_service.get_current_time", lambda: now)
+    return benchmark(budget_service.get_budget_status, "Food", "expense")
+
+
+# Period arithmetic is where these tests spend real CPU, so time it under one group
+_PERIOD_BENCHMARK = pytest.mark.benchmark(
+    group="budget_period", min_rounds=5, max_time=0.5
+)
 
 
 class TestGetBudgetStatus:
 
+    @_PERIOD_BENCHMARK
     def test_weekly_status_calculation(
-        self, budget_service, mock_db_session, mock_category_service
+        self,
+        budget_service,
+        mock_db_session,
+        mock_category_service,
+        monkeypatch,
+        benchmark,
     ):
-        category = MagicMock(id=1, type=TransactionType.EXPENSE, name="Food")
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        budget = Budget(
-            category_id=1,
-            limit_amount=Decimal("100"),
-            period=BudgetPeriod.WEEKLY,
-            start_date=datetime.now() - timedelta(days=3),
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-
-        t1 = MagicMock(
-            amount_in_myr=Decimal("40"), datetime=datetime.now() - timedelta(days=2)
+        # One clock reading keeps the budget and transaction dates consistent
+        now = datetime.now()
+        t1 = MagicMock(amount_in_myr=Decimal("40"), datetime=now - timedelta(days=2))
+        t2 = MagicMock(amount_in_myr=Decimal("30"), datetime=now - timedelta(days=1))
+
+        status = _run_status(
+            budget_service,
+            mock_db_session,
+            mock_category_service,
+            monkeypatch,
+            benchmark,
+            BudgetPeriod.WEEKLY,
+            now - timedelta(days=3),
+            now,
+            txns=[t1, t2],
         )
-        t2 = MagicMock(
-            amount_in_myr=Decimal("30"), datetime=datetime.now() - timedelta(days=1)
-        )
-        mock_db_session.query().filter().all.return_value = [t1, t2]
-
-        status = budget_service.get_budget_status("Food", "expense")
         assert status["spent"] == Decimal("70")
         assert status["remaining"] == Decimal("30")
         assert status["percentage"] == 70.0
         assert status["is_exceeded"] is False
 
-    def test_monthly_previous_period_until_day_reached(
-        self, budget_service, mock_db_session, mock_category_service
-    ):
-        category = MagicMock(id=1, type=TransactionType.EXPENSE, name="Food")
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        start_date = datetime(2023, 1, 31, 10, 0, 0)
-        budget = Budget(
-            category_id=1,
-            limit_amount=Decimal("100"),
-            period=BudgetPeriod.MONTHLY,
-            start_date=start_date,
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-        mock_db_session.query().filter().all.return_value = []
-
-        fixed_now = datetime(2023, 2, 15, 12, 0, 0)
-        with patch(
-            "app.services.budget_service.get_current_time", return_value=fixed_now
-        ):
-            status = budget_service.get_budget_status("Food", "expense")
-
-        assert status["period_start"].date() == datetime(2023, 1, 31).date()
-        assert status["period_end"].date() == datetime(2023, 2, 28).date()
-
-    def test_yearly_leap_day_transition(
-        self, budget_service, mock_db_session, mock_category_service
-    ):
-        category = MagicMock(id=1, type=TransactionType.EXPENSE, name="Bills")
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        start_date = datetime(2024, 2, 29, 9, 0, 0)
-        budget = Budget(
-            category_id=1,
-            limit_amount=Decimal("500"),
-            period=BudgetPeriod.YEARLY,
-            start_date=start_date,
-        )
-        mock_db_session.query().filter_by().first.return_value = budget
-        mock_db_session.query().filter().all.return_value = []
-
-        fixed_now = datetime(2025, 3, 1, 8, 0, 0)
-        with patch(
-            "app.services.budget_service.get_current_time", return_value=fixed_now
-        ):
-            status = budget_service.get_budget_status("Bills", "expense")
-
-        assert status["period_start"].date() == datetime(2025, 2, 28).date()
-        assert status["period_end"].date() == datetime(2026, 2, 28).date()
-
-    def test_future_start_date_returns_first_period(
-        self, budget_service, mock_db_session, mock_category_service
+    @pytest.mark.parametrize(
+        "period,start_date,now,expected_start,expected_end",
+        [
+            pytest.param(
+                BudgetPeriod.WEEKLY,
+                datetime(2024, 6, 7, 8, 0, 0),
+                NOW_2024_06_10,
+                datetime(2024, 6, 7, 8, 0, 0),
+                datetime(2024, 6, 14, 8, 0, 0),
+                id="weekly",
+            ),
+            pytest.param(
+                BudgetPeriod.MONTHLY,
+                datetime(2023, 1, 31, 10, 0, 0),
+                datetime(2023, 2, 15, 12, 0, 0),
+                datetime(2023, 1, 31).date(),
+                datetime(2023, 2, 28).date(),
+                id="monthly_previous_period_until_day_reached",
+            ),
+            pytest.param(
+                BudgetPeriod.YEARLY,
+                datetime(2024, 2, 29, 9, 0, 0),
+                datetime(2025, 3, 1, 8, 0, 0),
+                datetime(2025, 2, 28).date(),
+                datetime(2026, 2, 28).date(),
+                id="yearly_leap_day_transition",
+            ),
+            pytest.param(
+                BudgetPeriod.WEEKLY,
+                datetime(2025, 12, 1, 0, 0, 0),
+                datetime(2025, 11, 1, 0, 0, 0),
+                datetime(2025, 12, 1, 0, 0, 0),
+                datetime(2025, 12, 8, 0, 0, 0),
+                id="future_start_date_returns_first_period",
+            ),
+        ],
+    )
+    @_PERIOD_BENCHMARK
+    def test_period_status(
+        self,
+        budget_service,
+        mock_db_session,
+        mock_category_service,
+        monkeypatch,
+        benchmark,
+        period,
+        start_date,
+        now,
+        expected_start,
+        expected_end,
     ):
-        category = MagicMock(id=1, type=TransactionType.EXPENSE, name="Gym")
-        mock_category_service.get_category_by_name_and_type.return_value = category
-        start_date = datetime(2025, 12, 1, 0, 0, 0)
-        budget = Budget(
-            category_id=1,
-            limit_amount=Decimal("300"),
-            period=BudgetPeriod.WEEKLY,
-            start_date=start_date,
+        status = _run_status(
+            budget_service,
+            mock_db_session,
+            mock_category_service,
+            monkeypatch,
+            benchmark,
+            period,
+            start_date,
+            now,
         )
-        mock_db_session.query().filter_by().first.return_value = budget
-        mock_db_session.query().filter().all.return_value = []
 
-        fixed_now = datetime(2025, 11, 1, 0, 0, 0)
-        with patch(
-            "app.services.budget_service.get_current_time", return_value=fixed_now
-        ):
-            status = budget_service.get_budget_status("Gym", "expense")
-
-        assert status["period_start"] == start_date
-        assert status["period_end"] == start_date + timedelta(weeks=1)
+        start, end = status["period_start"], status["period_end"]
+        # Date-only expectations ignore the time of day the period rolls over at
+        if not isinstance(expected_start, datetime):
+            start, end = start.date(), end.date()
+        assert start == expected_start
+        assert end == expected_end
 
 
 class TestAllBudgetStatuses:
 
-    def test_skips_income_and_collects_expense(self, budget_service):
-        expense_category = MagicMock()
-        expense_category.type = TransactionType.EXPENSE
-        expense_category.name = "Food"
-        income_category = MagicMock()
-        income_category.type = TransactionType.INCOME
-        income_category.name = "Salary"
+    def test_skips_income_and_collects_expense(self, class_budget_service, monkeypatch):
+        expense_category = SimpleNamespace(type=TransactionType.EXPENSE, name="Food")
+        income_category = SimpleNamespace(type=TransactionType.INCOME, name="Salary")
 
-        b_expense = MagicMock(category=expense_category)
-        b_income = MagicMock(category=income_category)
-        budget_service.get_all_budgets = MagicMock(return_value=[b_expense, b_income])
+        b_expense = SimpleNamespace(category=expense_category)
+        b_income = SimpleNamespace(category=income_category)
+        monkeypatch.setattr(
+            class_budget_service,
+            "get_all_budgets",
+            MagicMock(return_value=[b_expense, b_income]),
+        )
 
         ok_status = {"percentage": 42, "budget": b_expense}
-        budget_service.get_budget_status = MagicMock(return_value=ok_status)
+        monkeypatch.setattr(
+            class_budget_service, "get_budget_status", MagicMock(return_value=ok_status)
+        )
 
-        statuses = budget_service.get_all_budget_statuses()
+        statuses = class_budget_service.get_all_budget_statuses()
         assert statuses == [ok_status]
-        budget_service.get_budget_status.assert_called_once_with("Food", "expense")
-
-    def test_errors_do_not_break_collection(self, budget_service):
-        expense_category = MagicMock()
-        expense_category.type = TransactionType.EXPENSE
-        expense_category.name = "A"
-        expense_category2 = MagicMock()
-        expense_category2.type = TransactionType.EXPENSE
-        expense_category2.name = "B"
-        b1 = MagicMock(category=expense_category)
-        b2 = MagicMock(category=expense_category2)
-        budget_service.get_all_budgets = MagicMock(return_value=[b1, b2])
-
-        def side_effect(name, ttype):
-            if name == "A":
-                raise NotFoundError()
-            return {"percentage": 10, "budget": b2}
-
-        budget_service.get_budget_status = MagicMock(side_effect=side_effect)
-        statuses = budget_service.get_all_budget_statuses()
+        class_budget_service.get_budget_status.assert_called_once_with(
+            "Food", "expense"
+        )
+
+    def test_errors_do_not_break_collection(self, class_budget_service, monkeypatch):
+        expense_category = SimpleNamespace(type=TransactionType.EXPENSE, name="A")
+        expense_category2 = SimpleNamespace(type=TransactionType.EXPENSE, name="B")
+        b1 = SimpleNamespace(category=expense_category)
+        b2 = SimpleNamespace(category=expense_category2)
+        monkeypatch.setattr(
+            class_budget_service, "get_all_budgets", MagicMock(return_value=[b1, b2])
+        )
+
+        # Statuses are requested in budget order: A fails, B succeeds
+        monkeypatch.setattr(
+            class_budget_service,
+            "get_budget_status",
+            Mock(side_effect=[NotFoundError(), {"percentage": 10, "budget": b2}]),
+        )
+        statuses = class_budget_service.get_all_budget_statuses()
         assert len(statuses) == 1
         assert statuses[0]["budget"] == b2
 
@@ -456,56 +500,49 @@ class TestCheckBudgetWarning:
         assert result["has_budget"] is False
         assert result["warning_level"] == "none"
 
-    def test_warning_levels_none_caution_warning_exceeded(self, budget_service):
-        # Base status: limit 100, current 0
-        base = {"limit": Decimal("100"), "spent": Decimal("0"), "percentage": 0.0}
-        budget_service.get_budget_status = MagicMock(return_value=base)
-
-        r1 = budget_service.check_budget_warning("Food", "expense", Decimal("10"))
-        assert r1["warning_level"] == "none"
-
-        budget_service.get_budget_status.return_value = {
-            "limit": Decimal("100"),
-            "spent": Decimal("79.9"),
-            "percentage": 79.9,
-        }
-        r2 = budget_service.check_budget_warning("Food", "expense", Decimal("0.2"))
-        assert r2["warning_level"] == "caution"
-
-        budget_service.get_budget_status.return_value = {
-            "limit": Decimal("100"),
-            "spent": Decimal("89.9"),
-            "percentage": 89.9,
-        }
-        r3 = budget_service.check_budget_warning("Food", "expense", Decimal("0.2"))
-        assert r3["warning_level"] == "warning"
-
-        budget_service.get_budget_status.return_value = {
-            "limit": Decimal("100"),
-            "spent": Decimal("100"),
-            "percentage": 100.0,
-        }
-        r4 = budget_service.check_budget_warning("Food", "expense", Decimal("1"))
-        assert r4["warning_level"] == "exceeded"
-        assert "BUDGET EXCEEDED" in r4["message"].upper()
+    @pytest.mark.parametrize(
+        "spent,pct,delta,level",
+        [
+            (Decimal("0"), 0.0, Decimal("10"), "none"),
+            (Decimal("79.9"), 79.9, Decimal("0.2"), "caution"),
+            (Decimal("89.9"), 89.9, Decimal("0.2"), "warning"),
+            (LIM100, 100.0, Decimal("1"), "exceeded"),
+        ],
+    )
+    def test_warning_level(self, budget_service, spent, pct, delta, level):
+        # Limit 100 with the given amount already spent
+        budget_service.get_budget_status = MagicMock(
+            return_value={"limit": LIM100, "spent": spent, "percentage": pct}
+        )
+
+        result = budget_service.check_budget_warning("Food", "expense", delta)
+        assert result["warning_level"] == level
+        if level == "exceeded":
+            assert _EXCEEDED_RE.search(result["message"])
 
 
 class TestGetBudgetsAtRisk:
 
-    def test_default_threshold_returns_above_80_sorted(self, budget_service):
-        status1 = {"percentage": 85, "budget": MagicMock()}
-        status2 = {"percentage": 50, "budget": MagicMock()}
-        status3 = {"percentage": 95, "budget": MagicMock()}
-        budget_service.get_all_budget_statuses = MagicMock(
-            return_value=[status1, status2, status3]
+    def test_default_threshold_returns_above_80_sorted(
+        self, class_budget_service, monkeypatch
+    ):
+        status1 = {"percentage": 85, "budget": object()}
+        status2 = {"percentage": 50, "budget": object()}
+        status3 = {"percentage": 95, "budget": object()}
+        monkeypatch.setattr(
+            class_budget_service,
+            "get_all_budget_statuses",
+            MagicMock(return_value=[status1, status2, status3]),
         )
-        at_risk = budget_service.get_budgets_at_risk()
+        at_risk = class_budget_service.get_budgets_at_risk()
         assert [s["percentage"] for s in at_risk] == [95, 85]
 
-    def test_custom_threshold(self, budget_service):
+    def test_custom_threshold(self, class_budget_service, monkeypatch):
         status1 = {"percentage": 70}
         status2 = {"percentage": 60}
-        budget_service.get_all_budget_statuses = MagicMock(
-            return_value=[status1, status2]
+        monkeypatch.setattr(
+            class_budget_service,
+            "get_all_budget_statuses",
+            MagicMock(return_value=[status1, status2]),
         )
-        assert budget_service.get_budgets_at_risk(threshold=65.0) == [status1]
+        assert class_budget_service.get_budgets_at_risk(threshold=65.0) == [status1]
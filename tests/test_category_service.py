@@ -1,6 +1,6 @@
 # tests/test_category_service.py
 
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -15,16 +15,22 @@ from app.exception import (
 from app.services.category_service import CategoryService
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_db_session():
-    return MagicMock()
+    return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def category_service(mock_db_session):
     return CategoryService(mock_db_session)
 
 
+@pytest.fixture(autouse=True)
+def reset_session(mock_db_session):
+    """Clear stubs and recorded calls left on the class-shared session."""
+    mock_db_session.reset_mock(return_value=True, side_effect=True)
+
+
 class TestGetCategories:
 
     @pytest.mark.parametrize(
@@ -116,15 +122,19 @@ class TestGetCategoryByNameAndType:
 
 class TestIsValidCategory:
 
-    def test_category_exists_returns_true(self, category_service, mock_db_session):
+    def test_category_exists_returns_true(self, category_service, monkeypatch):
         cat = Category(name="Salary", type=TransactionType.INCOME)
-        category_service.get_category_by_name_and_type = MagicMock(return_value=cat)
+        monkeypatch.setattr(
+            category_service, "get_category_by_name_and_type", Mock(return_value=cat)
+        )
         assert (
             category_service.is_valid_category("Salary", TransactionType.INCOME) is True
         )
 
-    def test_category_not_exists_returns_false(self, category_service, mock_db_session):
-        category_service.get_category_by_name_and_type = MagicMock(return_value=None)
+    def test_category_not_exists_returns_false(self, category_service, monkeypatch):
+        monkeypatch.setattr(
+            category_service, "get_category_by_name_and_type", Mock(return_value=None)
+        )
         assert (
             category_service.is_valid_category("Unknown", TransactionType.EXPENSE)
             is False
@@ -141,10 +151,17 @@ class TestAddCategory:
         ],
     )
     def test_add_income_category_success(
-        self, category_service, mock_db_session, category_name, transaction_type
+        self,
+        category_service,
+        monkeypatch,
+        mock_db_session,
+        category_name,
+        transaction_type,
     ):
         # Mock the method to return None (category doesn't exist)
-        category_service.get_category_by_name_and_type = MagicMock(return_value=None)
+        monkeypatch.setattr(
+            category_service, "get_category_by_name_and_type", lambda *a, **k: None
+        )
         cat = category_service.add_category(category_name, transaction_type)
 
         assert cat.name == category_name.strip().capitalize()
@@ -152,124 +169,159 @@ class TestAddCategory:
         mock_db_session.add.assert_called_once_with(cat)
         mock_db_session.commit.assert_called_once()
 
-    def test_add_expense_category_success(self, category_service, mock_db_session):
+    def test_add_expense_category_success(self, category_service, monkeypatch):
         # Mock the method to return None (category doesn't exist)
-        category_service.get_category_by_name_and_type = MagicMock(return_value=None)
-        cat = category_service.add_category("Groceries", "expense")
+        monkeypatch.setattr(
+            category_service, "get_category_by_name_and_type", lambda *a, **k: None
+        )
+        cat = category_service.add_category("Groceries", TransactionType.EXPENSE)
         assert cat.name == "Groceries"
         assert cat.type == TransactionType.EXPENSE
 
     @pytest.mark.parametrize(
-        "category_name,category_type,exception",
+        "category_name,category_type,setup,exception",
         [
-            ("", "income", InvalidInputError),
-            ("Misc", "invalid", InvalidInputError),
+            ("", "income", None, InvalidInputError),
+            ("Misc", "invalid", None, InvalidInputError),
+            ("Salary", "income", "duplicate", AlreadyExistsError),
+            ("Salary", "income", "integrity_error", AlreadyExistsError),
         ],
+        ids=["empty_name", "invalid_type", "duplicate", "commit_integrity_error"],
     )
-    def test_add_category_invalid_input_raises(
-        self, category_service, category_name, category_type, exception
+    def test_add_category_raises(
+        self,
+        category_service,
+        monkeypatch,
+        mock_db_session,
+        category_name,
+        category_type,
+        setup,
+        exception,
     ):
-        """Test that invalid inputs raise appropriate exceptions."""
+        if setup is not None:
+            # Only a category that already exists is reported as valid
+            monkeypatch.setattr(
+                category_service,
+                "is_valid_category",
+                lambda *a, **k: setup == "duplicate",
+            )
+        if setup == "integrity_error":
+            mock_db_session.commit.side_effect = IntegrityError("", "", "")
+
         with pytest.raises(exception):
             category_service.add_category(category_name, category_type)
 
-    def test_add_duplicate_category_raises(self, category_service):
-        category_service.is_valid_category = MagicMock(return_value=True)
-        with pytest.raises(AlreadyExistsError):
-            category_service.add_category("Salary", "income")
-
-    def test_add_category_commit_integrity_error_raises(
-        self, category_service, mock_db_session
-    ):
-        category_service.is_valid_category = MagicMock(return_value=False)
-        mock_db_session.commit.side_effect = IntegrityError("", "", "")
-        with pytest.raises(AlreadyExistsError):
-            category_service.add_category("Salary", "income")
-
 
 class TestEditCategory:
 
-    def test_edit_category_success(self, category_service, mock_db_session):
+    def test_edit_category_success(
+        self, category_service, monkeypatch, mock_db_session
+    ):
         old_cat = Category(name="Old", type=TransactionType.INCOME)
         old_cat.id = 1
-        category_service.get_category_by_name_and_type = MagicMock(
-            side_effect=[old_cat, None]
+        results = iter([old_cat, None])
+        monkeypatch.setattr(
+            category_service,
+            "get_category_by_name_and_type",
+            lambda *a, **k: next(results),
         )
-        updated = category_service.edit_category("Old", "New", "income")
+        updated = category_service.edit_category("Old", "New", TransactionType.INCOME)
         assert updated.name == "New"
         mock_db_session.commit.assert_called_once()
 
-    def test_edit_category_same_name_no_error(self, category_service, mock_db_session):
+    def test_edit_category_same_name_no_error(self, category_service, monkeypatch):
         cat = Category(name="Same", type=TransactionType.INCOME)
         cat.id = 1
-        category_service.get_category_by_name_and_type = MagicMock(
-            side_effect=[cat, cat]
+        results = iter([cat, cat])
+        monkeypatch.setattr(
+            category_service,
+            "get_category_by_name_and_type",
+            lambda *a, **k: next(results),
         )
-        updated = category_service.edit_category("Same", "Same", "income")
+        updated = category_service.edit_category("Same", "Same", TransactionType.INCOME)
         assert updated.name == "Same"
 
-    def test_edit_category_old_not_exist_raises(self, category_service):
-        category_service.get_category_by_name_and_type = MagicMock(return_value=None)
-        with pytest.raises(NotFoundError):
-            category_service.edit_category("Nonexistent", "New", "income")
-
-    def test_edit_category_new_name_exists_raises(self, category_service):
-        old_cat = Category(name="Old", type=TransactionType.INCOME)
-        old_cat.id = 1
-        new_cat = Category(name="New", type=TransactionType.INCOME)
-        new_cat.id = 2
-        category_service.get_category_by_name_and_type = MagicMock(
-            side_effect=[old_cat, new_cat]
-        )
-        with pytest.raises(AlreadyExistsError):
-            category_service.edit_category("Old", "New", "income")
-
-    def test_edit_category_empty_old_name_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.edit_category("", "New", "income")
+    @pytest.mark.parametrize(
+        "old_name,new_name,setup,exception",
+        [
+            ("", "New", None, InvalidInputError),
+            ("Old", "", None, InvalidInputError),
+            ("Nonexistent", "New", "missing", NotFoundError),
+            ("Old", "New", "taken", AlreadyExistsError),
+        ],
+        ids=["empty_old_name", "empty_new_name", "old_not_exist", "new_name_exists"],
+    )
+    def test_edit_category_raises(
+        self, category_service, monkeypatch, old_name, new_name, setup, exception
+    ):
+        if setup == "missing":
+            results = iter([None])
+        elif setup == "taken":
+            old_cat = Category(name="Old", type=TransactionType.INCOME)
+            old_cat.id = 1
+            new_cat = Category(name="New", type=TransactionType.INCOME)
+            new_cat.id = 2
+            results = iter([old_cat, new_cat])
+        if setup is not None:
+            monkeypatch.setattr(
+                category_service,
+                "get_category_by_name_and_type",
+                lambda *a, **k: next(results),
+            )
 
-    def test_edit_category_empty_new_name_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.edit_category("Old", "", "income")
+        with pytest.raises(exception):
+            category_service.edit_category(old_name, new_name, "income")
 
 
 class TestDeleteCategory:
 
-    def test_delete_existing_category_success(self, category_service, mock_db_session):
+    def test_delete_existing_category_success(
+        self, category_service, monkeypatch, mock_db_session
+    ):
         cat = Category(name="Salary", type=TransactionType.INCOME)
         cat.id = 1
 
-        category_service.get_category_by_name_and_type = MagicMock(return_value=cat)
+        monkeypatch.setattr(
+            category_service, "get_category_by_name_and_type", lambda *a, **k: cat
+        )
         mock_db_session.query().filter_by().first.return_value = None  # No transactions
 
-        result = category_service.delete_category("Salary", "income")
+        result = category_service.delete_category("Salary", TransactionType.INCOME)
 
         assert result is True
         mock_db_session.delete.assert_called_once_with(cat)
         mock_db_session.commit.assert_called_once()
 
-    def test_delete_category_used_in_transaction_raises(
-        self, category_service, mock_db_session
-    ):
-        cat = Category(name="Salary", type=TransactionType.INCOME)
-        cat.id = 1
-        category_service.get_category_by_name_and_type = MagicMock(return_value=cat)
-        trans = Transaction()
-        mock_db_session.query().filter_by().first.return_value = trans
-        with pytest.raises(CategoryInUseError):
-            category_service.delete_category("Salary", "income")
-
-    def test_delete_non_existing_category_raises(
-        self, category_service, mock_db_session
+    @pytest.mark.parametrize(
+        "category_name,category_type,setup,exception",
+        [
+            ("", "income", None, InvalidInputError),
+            ("Salary", "invalid", None, InvalidInputError),
+            ("Nonexistent", "income", "missing", NotFoundError),
+            ("Salary", "income", "in_use", CategoryInUseError),
+        ],
+        ids=["empty_name", "invalid_type", "not_exist", "used_in_transaction"],
+    )
+    def test_delete_category_raises(
+        self,
+        category_service,
+        monkeypatch,
+        mock_db_session,
+        category_name,
+        category_type,
+        setup,
+        exception,
     ):
-        category_service.get_category_by_name_and_type = MagicMock(return_value=None)
-        with pytest.raises(NotFoundError):
-            category_service.delete_category("Nonexistent", "income")
-
-    def test_delete_category_empty_name_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.delete_category("", "income")
+        if setup is not None:
+            cat = None
+            if setup == "in_use":
+                cat = Category(name="Salary", type=TransactionType.INCOME)
+                cat.id = 1
+                # A transaction still references the category
+                mock_db_session.query().filter_by().first.return_value = Transaction()
+            monkeypatch.setattr(
+                category_service, "get_category_by_name_and_type", lambda *a, **k: cat
+            )
 
-    def test_delete_category_invalid_type_raises(self, category_service):
-        with pytest.raises(InvalidInputError):
-            category_service.delete_category("Salary", "invalid")
+        with pytest.raises(exception):
+            category_service.delete_category(category_name, category_type)
@@ -1,8 +1,9 @@
 # tests/test_filter_service.py
 
+from collections import namedtuple
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,183 +11,169 @@ from app.database.models import Account, Category, Transaction, TransactionType
 from app.exception import InvalidInputError, NotFoundError
 from app.services.filter_service import FilterService
 
-
-@pytest.fixture
-def mock_db_session():
-    return MagicMock()
+# Fixed timestamp for seeded transactions; no filter depends on the clock
+FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_account_service():
-    return MagicMock()
+    return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_category_service():
-    return MagicMock()
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_account_service, mock_category_service):
+    """Reset the module-shared lookup mocks before each test."""
+    for mock in (mock_account_service, mock_category_service):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="class")
+def _class_filter_service(mock_account_service, mock_category_service):
+    # The session is per test, so it is bound in filter_service below
+    return FilterService(None, mock_account_service, mock_category_service)
 
 
 @pytest.fixture
-def filter_service(mock_db_session, mock_account_service, mock_category_service):
-    return FilterService(mock_db_session, mock_account_service, mock_category_service)
-
-
-def create_transaction(
-    id=1,
-    account_id=1,
-    category_id=1,
-    t_type=TransactionType.EXPENSE,
-    amount=Decimal("10.00"),
-):
-    transaction = Transaction(
-        id=id,
-        account_id=account_id,
-        category_id=category_id,
-        transaction_type=t_type,
-        amount=amount,
+def filter_service(_class_filter_service, db_session):
+    """Class-shared FilterService bound to this test's session."""
+    _class_filter_service.db_session = db_session
+    return _class_filter_service
+
+
+def seed(db_session, *rows):
+    """Insert the given rows so the service's queries can find them."""
+    db_session.add_all(rows)
+    db_session.flush()
+
+
+@pytest.fixture(scope="session")
+def _txn_template():
+    """Default column values for seeded transactions."""
+    return dict(
+        id=1,
+        account_id=1,
+        category_id=1,
+        transaction_type=TransactionType.EXPENSE,
+        amount=Decimal("10.00"),
         currency="MYR",
-        amount_in_myr=amount,  # For tests, use same amount
-        datetime=datetime.now(),
+        amount_in_myr=Decimal("10.00"),  # For tests, use same amount
+        datetime=FIXED_DT,
         description="Test transaction",
     )
-    return transaction
-
 
-class TestFilterByCategory:
 
-    def test_existing_category_returns_transactions(
-        self, filter_service, mock_category_service, mock_db_session
-    ):
-        category = Category(id=1, name="Food", type=TransactionType.EXPENSE)
-        mock_category_service.get_category.return_value = category
-        transactions = [
-            create_transaction(id=1, category_id=1),
-            create_transaction(id=2, category_id=1),
-        ]
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = (
-            transactions
-        )
+@pytest.fixture
+def make_transaction(_txn_template):
+    """Return a factory building a template transaction with overrides."""
 
-        result = filter_service.filter_transaction_by_category("Food")
-        assert result == transactions
+    def _make(t_type=None, amount=None, **overrides):
+        if t_type is not None:
+            overrides["transaction_type"] = t_type
+        if amount is not None:
+            overrides["amount"] = overrides["amount_in_myr"] = amount
+        return Transaction(**{**_txn_template, **overrides})
 
-    def test_category_with_no_transactions_returns_empty_list(
-        self, filter_service, mock_category_service, mock_db_session
-    ):
-        category = Category(id=1, name="Empty", type=TransactionType.EXPENSE)
-        mock_category_service.get_category.return_value = category
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = []
-
-        result = filter_service.filter_transaction_by_category("Empty")
-        assert result == []
+    return _make
 
-    def test_category_name_trim_and_case_insensitive(
-        self, filter_service, mock_category_service, mock_db_session
-    ):
-        category = Category(id=1, name="Food", type=TransactionType.EXPENSE)
-        mock_category_service.get_category.return_value = category
-        transaction = create_transaction(category_id=1)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
 
-        result = filter_service.filter_transaction_by_category("  food  ")
-        assert result == [transaction]
+FilterTarget = namedtuple("FilterTarget", "lookup filter row key name")
 
-    def test_empty_category_name_raises_error(self, filter_service):
-        with pytest.raises(InvalidInputError):
-            filter_service.filter_transaction_by_category("  ")
 
-    def test_nonexistent_category_raises_error(
-        self, filter_service, mock_category_service
-    ):
-        mock_category_service.get_category.return_value = None
-        with pytest.raises(NotFoundError):
-            filter_service.filter_transaction_by_category("Unknown")
+@pytest.fixture(params=["category", "account"])
+def filter_target(request, filter_service, mock_category_service, mock_account_service):
+    """Wire the lookup mock, filter method and seeded row for one filter kind."""
+    if request.param == "category":
+        return FilterTarget(
+            mock_category_service.get_category,
+            filter_service.filter_transaction_by_category,
+            Category(id=1, name="Food", type=TransactionType.EXPENSE),
+            "category_id",
+            "Food",
+        )
+    return FilterTarget(
+        mock_account_service.get_account,
+        filter_service.filter_transaction_by_account,
+        Account(id=1, account_name="Wallet", balance=Decimal("100.00")),
+        "account_id",
+        "Wallet",
+    )
 
 
-class TestFilterByAccount:
+class TestFilterByCategoryOrAccount:
 
-    def test_existing_account_returns_transactions(
-        self, filter_service, mock_account_service, mock_db_session
+    def test_existing_returns_transactions(
+        self, filter_target, make_transaction, db_session
     ):
-        account = Account(id=1, account_name="Wallet", balance=Decimal("100.00"))
-        mock_account_service.get_account.return_value = account
+        filter_target.lookup.return_value = filter_target.row
         transactions = [
-            create_transaction(id=1, account_id=1),
-            create_transaction(id=2, account_id=1),
+            make_transaction(id=1, **{filter_target.key: 1}),
+            make_transaction(id=2, **{filter_target.key: 1}),
         ]
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = (
-            transactions
+        # A row belonging to another category/account must not come back
+        seed(
+            db_session, *transactions, make_transaction(id=3, **{filter_target.key: 2})
         )
 
-        result = filter_service.filter_transaction_by_account("Wallet")
+        result = filter_target.filter(filter_target.name)
         assert result == transactions
 
-    def test_account_with_no_transactions_returns_empty_list(
-        self, filter_service, mock_account_service, mock_db_session
-    ):
-        account = Account(id=1, account_name="Empty", balance=Decimal("0.00"))
-        mock_account_service.get_account.return_value = account
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = []
+    def test_no_transactions_returns_empty_list(self, filter_target):
+        filter_target.lookup.return_value = filter_target.row
 
-        result = filter_service.filter_transaction_by_account("Empty")
+        result = filter_target.filter(filter_target.name)
         assert result == []
 
-    def test_account_name_trim_and_case_insensitive(
-        self, filter_service, mock_account_service, mock_db_session
+    def test_name_trim_and_case_insensitive(
+        self, filter_target, make_transaction, db_session
     ):
-        account = Account(id=1, account_name="Wallet", balance=Decimal("100.00"))
-        mock_account_service.get_account.return_value = account
-        transaction = create_transaction(account_id=1)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
+        filter_target.lookup.return_value = filter_target.row
+        transaction = make_transaction(**{filter_target.key: 1})
+        seed(db_session, transaction)
 
-        result = filter_service.filter_transaction_by_account("  wallet  ")
+        result = filter_target.filter(f"  {filter_target.name.lower()}  ")
         assert result == [transaction]
 
-    def test_empty_account_name_raises_error(self, filter_service):
+    def test_empty_name_raises_error(self, filter_target):
         with pytest.raises(InvalidInputError):
-            filter_service.filter_transaction_by_account("  ")
+            filter_target.filter("  ")
 
-    def test_nonexistent_account_raises_error(
-        self, filter_service, mock_account_service
-    ):
-        mock_account_service.get_account.return_value = None
+    def test_nonexistent_raises_error(self, filter_target):
+        filter_target.lookup.return_value = None
         with pytest.raises(NotFoundError):
-            filter_service.filter_transaction_by_account("Unknown")
+            filter_target.filter("Unknown")
 
 
 class TestFilterByTransactionType:
 
-    def test_filter_income_transactions(self, filter_service, mock_db_session):
-        transaction = create_transaction(id=1, t_type=TransactionType.INCOME)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
-
-        result = filter_service.filter_transaction_by_transaction_type("income")
-        assert result == [transaction]
-
-    def test_filter_expense_transactions(self, filter_service, mock_db_session):
-        transaction = create_transaction(id=1, t_type=TransactionType.EXPENSE)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
-
-        result = filter_service.filter_transaction_by_transaction_type("expense")
-        assert result == [transaction]
-
-    def test_transaction_type_trim_and_case_insensitive(
-        self, filter_service, mock_db_session
+    @pytest.mark.parametrize(
+        "input_str,t_type",
+        [
+            ("income", TransactionType.INCOME),
+            ("expense", TransactionType.EXPENSE),
+            ("  ExPeNse ", TransactionType.EXPENSE),  # Trim and case insensitive
+            ("InCoMe", TransactionType.INCOME),  # Case insensitive
+        ],
+    )
+    def test_filter_by_transaction_type(
+        self, filter_service, make_transaction, db_session, input_str, t_type
     ):
-        transaction = create_transaction(id=1, t_type=TransactionType.EXPENSE)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
+        # Nothing matches before any rows exist
+        assert filter_service.filter_transaction_by_transaction_type(input_str) == []
+
+        transaction = make_transaction(id=1, t_type=t_type)
+        other_type = (
+            TransactionType.EXPENSE
+            if t_type == TransactionType.INCOME
+            else TransactionType.INCOME
+        )
+        seed(db_session, transaction, make_transaction(id=2, t_type=other_type))
 
-        result = filter_service.filter_transaction_by_transaction_type("  ExPeNse ")
+        result = filter_service.filter_transaction_by_transaction_type(input_str)
         assert result == [transaction]
 
     def test_invalid_transaction_type_raises_error(self, filter_service):
@@ -203,19 +190,18 @@ class TestCombinedFilters:
     def test_filter_by_category_then_account(
         self,
         filter_service,
+        make_transaction,
         mock_category_service,
         mock_account_service,
-        mock_db_session,
+        db_session,
     ):
         category = Category(id=1, name="Food", type=TransactionType.EXPENSE)
         account = Account(id=1, account_name="Wallet", balance=Decimal("100.00"))
         mock_category_service.get_category.return_value = category
         mock_account_service.get_account.return_value = account
 
-        transaction = create_transaction(account_id=1, category_id=1)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
+        transaction = make_transaction(account_id=1, category_id=1)
+        seed(db_session, transaction)
 
         category_filtered = filter_service.filter_transaction_by_category("Food")
         account_filtered = filter_service.filter_transaction_by_account("Wallet")
@@ -224,42 +210,31 @@ class TestCombinedFilters:
         result = [t for t in category_filtered if t in account_filtered]
         assert result == [transaction]
 
-    def test_add_edit_delete_transaction_reflects_in_filter(
-        self,
-        filter_service,
-        mock_category_service,
-        mock_account_service,
-        mock_db_session,
-    ):
-        # Initial transaction
+    @pytest.fixture
+    def base_filter_data(self, make_transaction, mock_category_service, db_session):
+        """Seed one Food transaction and return it with a second, unsaved one."""
         category = Category(id=1, name="Food", type=TransactionType.EXPENSE)
-        account = Account(id=1, account_name="Wallet", balance=Decimal("100.00"))
-        transaction = create_transaction(account_id=1, category_id=1)
         mock_category_service.get_category.return_value = category
-        mock_account_service.get_account.return_value = account
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
+        transaction = make_transaction(account_id=1, category_id=1)
+        seed(db_session, transaction)
+        return transaction, make_transaction(id=2, account_id=1, category_id=1)
 
-        # Add a new transaction
-        new_transaction = create_transaction(id=2, account_id=1, category_id=1)
-        transactions = [transaction, new_transaction]
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = (
-            transactions
-        )
+    @pytest.mark.parametrize("scenario", ["initial", "added", "deleted"])
+    def test_add_delete_transaction_reflects_in_filter(
+        self, filter_service, db_session, base_filter_data, scenario
+    ):
+        transaction, new_transaction = base_filter_data
+        expected = [transaction]
 
-        result = filter_service.filter_transaction_by_category("Food")
-        assert new_transaction in result
-        assert transaction in result
+        if scenario in ("added", "deleted"):
+            seed(db_session, new_transaction)
+            expected = [transaction, new_transaction]
+        if scenario == "deleted":
+            db_session.delete(transaction)
+            db_session.flush()
+            expected = [new_transaction]
 
-        # Delete transaction
-        transactions.remove(transaction)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = (
-            transactions
-        )
-        result_after_delete = filter_service.filter_transaction_by_category("Food")
-        assert transaction not in result_after_delete
-        assert new_transaction in result_after_delete
+        assert filter_service.filter_transaction_by_category("Food") == expected
 
     def test_deleting_category_or_account_used_by_transactions_raises_error(
         self, filter_service, mock_category_service, mock_account_service
@@ -273,55 +248,3 @@ class TestCombinedFilters:
         mock_account_service.get_account.return_value = None
         with pytest.raises(NotFoundError):
             filter_service.filter_transaction_by_account("Wallet")
-
-
-class TestNormalizationValidation:
-
-    def test_category_account_trimmed(
-        self,
-        filter_service,
-        mock_category_service,
-        mock_account_service,
-        mock_db_session,
-    ):
-        category = Category(id=1, name="Food", type=TransactionType.EXPENSE)
-        account = Account(id=1, account_name="Wallet", balance=Decimal("100.00"))
-        transaction = create_transaction(account_id=1, category_id=1)
-        mock_category_service.get_category.return_value = category
-        mock_account_service.get_account.return_value = account
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
-
-        result_category = filter_service.filter_transaction_by_category("  food  ")
-        result_account = filter_service.filter_transaction_by_account("  wallet  ")
-        assert result_category == [transaction]
-        assert result_account == [transaction]
-
-    def test_transaction_type_case_insensitive(self, filter_service, mock_db_session):
-        transaction = create_transaction(id=1, t_type=TransactionType.INCOME)
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = [
-            transaction
-        ]
-
-        result = filter_service.filter_transaction_by_transaction_type("InCoMe")
-        assert result == [transaction]
-
-    def test_empty_dataset_returns_empty_list(
-        self,
-        filter_service,
-        mock_category_service,
-        mock_account_service,
-        mock_db_session,
-    ):
-        mock_category_service.get_category.return_value = Category(
-            id=1, name="Food", type=TransactionType.EXPENSE
-        )
-        mock_account_service.get_account.return_value = Account(
-            id=1, account_name="Wallet", balance=Decimal("0.00")
-        )
-        mock_db_session.query.return_value.filter_by.return_value.all.return_value = []
-
-        assert filter_service.filter_transaction_by_category("Food") == []
-        assert filter_service.filter_transaction_by_account("Wallet") == []
-        assert filter_service.filter_transaction_by_transaction_type("expense") == []
@@ -2,43 +2,83 @@
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from collections import namedtuple
+from unittest.mock import Mock
 
 import pytest
+from sqlalchemy.orm import Session
 
 from app.database.models import Goal, Transaction, TransactionType
 from app.exception import AlreadyExistsError, InvalidInputError, NotFoundError
+from app.services.account_service import AccountService
 from app.services.goal_service import GoalService
 
+D0 = Decimal("0")
+D10 = Decimal("10")
+D100 = Decimal("100")
+D200 = Decimal("200")
+D500 = Decimal("500")
 
-@pytest.fixture
+# Clock read once at import; the deadline-edge tests still call date.today()
+TODAY = date.today()
+NOW = datetime.now()
+NEXT_MONTH = TODAY + timedelta(days=30)
+
+# Plain data stand-ins; the service only reads these attributes
+Txn = namedtuple("Txn", "amount_in_myr")
+Acct = namedtuple("Acct", "id name balance", defaults=(None, None, D0))
+
+
+# Spec'd mocks are built once per session and reset for each test
+@pytest.fixture(scope="session")
 def mock_db_session():
-    return MagicMock()
+    return Mock(spec=Session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_account_service():
-    return MagicMock()
+    return Mock(spec=AccountService)
+
+
+def _stub_first(session, value):
+    # Walk the stub chain through return_value so no query() calls get recorded
+    session.query.return_value.filter_by.return_value.first.return_value = value
 
 
 @pytest.fixture
+def stub_first(mock_db_session):
+    """Return a setter for the session's query().filter_by().first() result."""
+    return lambda value: _stub_first(mock_db_session, value)
+
+
+@pytest.fixture(scope="module")
 def goal_service(mock_db_session, mock_account_service):
+    """One GoalService shared by every test in this module."""
     return GoalService(mock_db_session, mock_account_service)
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_db_session, mock_account_service):
+    """Reset the spec'd mocks before each test, even goal_service-only ones."""
+    # Stubbed service methods go through monkeypatch, so they are undone too
+    for mock in (mock_db_session, mock_account_service):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 class TestAddGoal:
 
     def test_add_goal_with_linked_account_success(
-        self, goal_service, mock_db_session, mock_account_service
+        self, goal_service, stub_first, mock_db_session, mock_account_service
     ):
         # No duplicate name
-        mock_db_session.query().filter_by().first.return_value = None
+        stub_first(None)
 
         # Found linked account with current balance
-        account = MagicMock(id=1, balance=Decimal("1000.00"))
+        account = Acct(id=1, balance=Decimal("1000.00"))
         mock_account_service.get_account.return_value = account
 
-        future_deadline = date.today() + timedelta(days=30)
+        future_deadline = NEXT_MONTH
         g = goal_service.add_goal(
             name="new goal",
             target_amount="500",
@@ -50,9 +90,8 @@ class TestAddGoal:
         assert isinstance(g, Goal)
         assert g.name == "New goal"  # capitalized by validator
         assert g.target_amount == Decimal("500.00")
-        assert g.initial_balance == Decimal(
-            "0"
-        )  # Always starts at 0 with net income tracking
+        # Always starts at 0 with net income tracking
+        assert g.initial_balance == D0
         assert g.account_id == 1
         assert g.is_completed == 0
         assert g.description == "save more"
@@ -60,139 +99,165 @@ class TestAddGoal:
         mock_db_session.commit.assert_called_once()
 
     def test_add_goal_without_account_uses_zero_initial_balance(
-        self, goal_service, mock_db_session, mock_account_service
+        self, goal_service, stub_first, mock_db_session, mock_account_service
     ):
         # No duplicate
-        mock_db_session.query().filter_by().first.return_value = None
+        stub_first(None)
 
         # Two accounts with balances (not used for initial_balance anymore)
-        acc1 = MagicMock(balance=Decimal("100.00"))
-        acc2 = MagicMock(balance=Decimal("250.50"))
+        acc1 = Acct(balance=Decimal("100.00"))
+        acc2 = Acct(balance=Decimal("250.50"))
         mock_account_service.get_all_accounts.return_value = [acc1, acc2]
 
-        future_deadline = date.today() + timedelta(days=10)
+        future_deadline = TODAY + timedelta(days=10)
         g = goal_service.add_goal(
             name="Emergency",
             target_amount="200",
             deadline=future_deadline,
         )
 
-        assert g.initial_balance == Decimal(
-            "0"
-        )  # Always starts at 0 with net income tracking
+        # Always starts at 0 with net income tracking
+        assert g.initial_balance == D0
         assert g.account_id is None
 
-    def test_add_goal_duplicate_name_raises(self, goal_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = MagicMock()
-        with pytest.raises(AlreadyExistsError):
-            goal_service.add_goal("Test", "100", date.today() + timedelta(days=1))
-
-    def test_add_goal_invalid_amount_raises(self, goal_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(InvalidInputError):
-            goal_service.add_goal("Test", "-1", date.today() + timedelta(days=1))
-
-    def test_add_goal_deadline_today_raises(self, goal_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = None
-        with pytest.raises(InvalidInputError):
-            goal_service.add_goal("Test", "100", date.today())
-
-    def test_add_goal_linked_account_not_found_raises(
-        self, goal_service, mock_db_session, mock_account_service
+    @pytest.mark.parametrize(
+        "duplicate,args,kwargs,exception",
+        [
+            (True, ("Test", "100", 1), {}, AlreadyExistsError),
+            (False, ("Test", "-1", 1), {}, InvalidInputError),
+            (False, ("Test", "100", 0), {}, InvalidInputError),
+            (False, ("Test", "100", 1), {"account_name": "X"}, NotFoundError),
+        ],
+        ids=[
+            "duplicate_name",
+            "invalid_amount",
+            "deadline_today",
+            "linked_account_not_found",
+        ],
+    )
+    def test_add_goal_rejects(
+        self,
+        goal_service,
+        stub_first,
+        mock_account_service,
+        duplicate,
+        args,
+        kwargs,
+        exception,
     ):
-        mock_db_session.query().filter_by().first.return_value = None
+        stub_first(SimpleNamespace(name="Test") if duplicate else None)
         mock_account_service.get_account.return_value = None
-        with pytest.raises(NotFoundError):
+        # The last positional argument is the deadline as days from today
+        name, amount, days = args
+        with pytest.raises(exception):
             goal_service.add_goal(
-                "Test", "100", date.today() + timedelta(days=1), account_name="X"
+                name, amount, date.today() + timedelta(days=days), **kwargs
             )
 
 
 class TestGetGoals:
 
-    def test_get_goal_by_id(self, goal_service, mock_db_session):
+    def test_get_goal_by_id(self, goal_service, stub_first):
         goal = Goal(
             id=1,
             name="A",
-            target_amount=Decimal("10"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D10,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
         )
-        mock_db_session.query().filter_by().first.return_value = goal
+        stub_first(goal)
         assert goal_service.get_goal(1) == goal
 
-    def test_get_goal_by_id_not_found(self, goal_service, mock_db_session):
-        mock_db_session.query().filter_by().first.return_value = None
+    def test_get_goal_by_id_not_found(self, goal_service, stub_first):
+        stub_first(None)
         assert goal_service.get_goal(999) is None
 
     def test_get_all_goals_order(self, goal_service, mock_db_session):
         g1 = Goal(
             id=1,
             name="A",
-            target_amount=Decimal("10"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D10,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=0,
         )
         g2 = Goal(
             id=2,
             name="B",
             target_amount=Decimal("20"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=1,
         )
-        mock_db_session.query().order_by().all.return_value = [g1, g2]
+        query = mock_db_session.query.return_value.options.return_value
+        query.order_by.return_value.all.return_value = [g1, g2]
         assert goal_service.get_all_goals() == [g1, g2]
 
     def test_get_active_goals(self, goal_service, mock_db_session):
         g1 = Goal(
             id=1,
             name="A",
-            target_amount=Decimal("10"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D10,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=0,
         )
-        mock_db_session.query().filter().order_by().all.return_value = [g1]
+        query = mock_db_session.query.return_value.options.return_value
+        query.filter.return_value.order_by.return_value.all.return_value = [g1]
         assert goal_service.get_active_goals() == [g1]
 
 
+# calculate_goal_progress only reads its goal, so each is built once per module
+@pytest.fixture(scope="module")
+def all_accounts_goal():
+    """Goal without specific account - uses net income tracking."""
+    return Goal(
+        id=3,
+        name="Save",
+        target_amount=D500,
+        initial_balance=D0,  # Always 0 with net income tracking
+        deadline=datetime.combine(TODAY + timedelta(days=20), datetime.min.time()),
+        created_at=datetime.combine(TODAY - timedelta(days=10), datetime.min.time()),
+    )
+
+
+@pytest.fixture(scope="module")
+def linked_goal():
+    """Goal linked to account 1."""
+    return Goal(
+        id=4,
+        name="Phone",
+        target_amount=D200,
+        initial_balance=D0,  # Always 0 with net income tracking
+        deadline=datetime.combine(TODAY + timedelta(days=5), datetime.min.time()),
+        created_at=datetime.combine(TODAY - timedelta(days=5), datetime.min.time()),
+        account_id=1,
+    )
+
+
+@pytest.mark.slow
 class TestCalculateGoalProgress:
 
     def test_progress_for_all_accounts_on_track(
-        self, goal_service, mock_db_session, mock_account_service
+        self, goal_service, mock_db_session, mock_account_service, all_accounts_goal
     ):
-        # Goal without specific account - uses net income tracking
-        today = date.today()
-        goal = Goal(
-            id=3,
-            name="Save",
-            target_amount=Decimal("500"),
-            initial_balance=Decimal("0"),  # Always 0 with net income tracking
-            deadline=datetime.combine(today + timedelta(days=20), datetime.min.time()),
-            created_at=datetime.combine(
-                today - timedelta(days=10), datetime.min.time()
-            ),
-        )
-
         # Mock transactions: Income = 400, Expenses = 100, Net = 300
-        income_txn = MagicMock(amount_in_myr=Decimal("400"))
-        expense_txn = MagicMock(amount_in_myr=Decimal("100"))
+        income_txn = Txn(Decimal("400"))
+        expense_txn = Txn(D100)
 
         # Mock query chain for transactions
-        mock_query = MagicMock()
+        mock_query = Mock()
         mock_db_session.query.return_value = mock_query
         mock_query.filter.return_value = mock_query
 
         # First call returns income transactions, second call returns expense transactions
         mock_query.all.side_effect = [[income_txn], [expense_txn]]
 
-        result = goal_service.calculate_goal_progress(goal)
+        result = goal_service.calculate_goal_progress(all_accounts_goal)
 
         assert result["progress_amount"] == pytest.approx(300.0)  # 400 - 100
         assert result["progress_pct"] == pytest.approx(60.0)
@@ -207,36 +272,25 @@ class TestCalculateGoalProgress:
         assert result["account_name"] == "All Accounts"
 
     def test_progress_for_linked_account_achieved(
-        self, goal_service, mock_db_session, mock_account_service
+        self, goal_service, mock_db_session, mock_account_service, linked_goal
     ):
-        today = date.today()
-        goal = Goal(
-            id=4,
-            name="Phone",
-            target_amount=Decimal("200"),
-            initial_balance=Decimal("0"),  # Always 0 with net income tracking
-            deadline=datetime.combine(today + timedelta(days=5), datetime.min.time()),
-            created_at=datetime.combine(today - timedelta(days=5), datetime.min.time()),
-            account_id=1,
-        )
-
         # Mock account
-        acc = MagicMock(id=1, name="Savings", balance=Decimal("250"))
+        acc = Acct(id=1, name="Savings", balance=Decimal("250"))
         mock_account_service.get_account.return_value = acc
 
         # Mock transactions: Income = 300, Expenses = 50, Net = 250 (125% of 200 target)
-        income_txn = MagicMock(amount_in_myr=Decimal("300"))
-        expense_txn = MagicMock(amount_in_myr=Decimal("50"))
+        income_txn = Txn(Decimal("300"))
+        expense_txn = Txn(Decimal("50"))
 
         # Mock query chain for transactions
-        mock_query = MagicMock()
+        mock_query = Mock()
         mock_db_session.query.return_value = mock_query
         mock_query.filter.return_value = mock_query
 
         # First call returns income transactions, second call returns expense transactions
         mock_query.all.side_effect = [[income_txn], [expense_txn]]
 
-        result = goal_service.calculate_goal_progress(goal)
+        result = goal_service.calculate_goal_progress(linked_goal)
         assert result["progress_amount"] == pytest.approx(250.0)  # 300 - 50
         assert result["progress_pct"] == pytest.approx(125.0)
         assert result["status"] in {"on_track", "achieved"}
@@ -244,22 +298,24 @@ class TestCalculateGoalProgress:
 
 class TestEditGoal:
 
-    def test_edit_goal_success(self, goal_service, mock_db_session):
+    def test_edit_goal_success(
+        self, goal_service, stub_first, monkeypatch, mock_db_session
+    ):
         existing = Goal(
             id=10,
             name="Old",
-            target_amount=Decimal("100"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now() + timedelta(days=10),
-            created_at=datetime.now(),
+            target_amount=D100,
+            initial_balance=D0,
+            deadline=NOW + timedelta(days=10),
+            created_at=NOW,
             description="desc",
         )
         # get_goal -> returns existing
-        goal_service.get_goal = MagicMock(return_value=existing)
+        monkeypatch.setattr(goal_service, "get_goal", Mock(return_value=existing))
         # duplicate name check -> none
-        mock_db_session.query().filter_by().first.return_value = None
+        stub_first(None)
 
-        new_deadline = date.today() + timedelta(days=30)
+        new_deadline = NEXT_MONTH
         updated = goal_service.edit_goal(
             goal_id=10,
             name="new name",
@@ -274,95 +330,101 @@ class TestEditGoal:
         assert updated.description == "updated"
         mock_db_session.commit.assert_called_once()
 
-    def test_edit_goal_duplicate_new_name_raises(self, goal_service, mock_db_session):
+    @pytest.mark.parametrize(
+        "found,duplicate,kwargs,exception",
+        [
+            (True, True, {"name": "Other"}, AlreadyExistsError),
+            (True, False, {"deadline": 0}, InvalidInputError),
+            (False, False, {"name": "any"}, NotFoundError),
+        ],
+        ids=["duplicate_new_name", "invalid_deadline", "not_found"],
+    )
+    def test_edit_goal_rejects(
+        self,
+        goal_service,
+        stub_first,
+        monkeypatch,
+        found,
+        duplicate,
+        kwargs,
+        exception,
+    ):
         existing = Goal(
             id=11,
             name="Keep",
             target_amount=Decimal("50"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
         )
-        goal_service.get_goal = MagicMock(return_value=existing)
-        # Duplicate exists
-        mock_db_session.query().filter_by().first.return_value = MagicMock()
-        with pytest.raises(AlreadyExistsError):
-            goal_service.edit_goal(11, name="Other")
-
-    def test_edit_goal_invalid_deadline_raises(self, goal_service):
-        existing = Goal(
-            id=12,
-            name="X",
-            target_amount=Decimal("50"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+        monkeypatch.setattr(
+            goal_service,
+            "get_goal",
+            Mock(return_value=existing if found else None),
         )
-        goal_service.get_goal = MagicMock(return_value=existing)
-        with pytest.raises(InvalidInputError):
-            goal_service.edit_goal(12, deadline=date.today())
-
-    def test_edit_goal_not_found_raises(self, goal_service):
-        goal_service.get_goal = MagicMock(return_value=None)
-        with pytest.raises(NotFoundError):
-            goal_service.edit_goal(999, name="any")
+        stub_first(SimpleNamespace(name="Other") if duplicate else None)
+        if "deadline" in kwargs:
+            kwargs = {"deadline": date.today() + timedelta(days=kwargs["deadline"])}
+        with pytest.raises(exception):
+            goal_service.edit_goal(11, **kwargs)
 
 
 class TestMarkDeleteGoal:
 
-    def test_mark_goal_completed(self, goal_service, mock_db_session):
+    def test_mark_goal_completed(self, goal_service, monkeypatch, mock_db_session):
         existing = Goal(
             id=20,
             name="G",
-            target_amount=Decimal("10"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D10,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=0,
         )
-        goal_service.get_goal = MagicMock(return_value=existing)
+        monkeypatch.setattr(goal_service, "get_goal", Mock(return_value=existing))
         result = goal_service.mark_goal_completed(20)
         assert result.is_completed == 1
         mock_db_session.commit.assert_called_once()
 
-    def test_mark_goal_completed_not_found(self, goal_service):
-        goal_service.get_goal = MagicMock(return_value=None)
+    def test_mark_goal_completed_not_found(self, goal_service, monkeypatch):
+        monkeypatch.setattr(goal_service, "get_goal", Mock(return_value=None))
         with pytest.raises(NotFoundError):
             goal_service.mark_goal_completed(1)
 
-    def test_delete_goal_success(self, goal_service, mock_db_session):
+    def test_delete_goal_success(self, goal_service, monkeypatch, mock_db_session):
         existing = Goal(
             id=21,
             name="G",
-            target_amount=Decimal("10"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D10,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
         )
-        goal_service.get_goal = MagicMock(return_value=existing)
+        monkeypatch.setattr(goal_service, "get_goal", Mock(return_value=existing))
         assert goal_service.delete_goal(21) is True
         mock_db_session.delete.assert_called_once_with(existing)
         mock_db_session.commit.assert_called_once()
 
-    def test_delete_goal_not_found(self, goal_service):
-        goal_service.get_goal = MagicMock(return_value=None)
+    def test_delete_goal_not_found(self, goal_service, monkeypatch):
+        monkeypatch.setattr(goal_service, "get_goal", Mock(return_value=None))
         with pytest.raises(NotFoundError):
             goal_service.delete_goal(999)
 
 
+@pytest.mark.slow
 class TestGoalsSummary:
 
-    def test_summary_no_active_goals(self, goal_service):
+    def test_summary_no_active_goals(self, goal_service, monkeypatch):
         g1 = Goal(
             id=1,
             name="A",
-            target_amount=Decimal("100"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D100,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=1,
         )
-        goal_service.get_all_goals = MagicMock(return_value=[g1])
+        monkeypatch.setattr(goal_service, "get_all_goals", Mock(return_value=[g1]))
         s = goal_service.get_goals_summary()
         assert s["total_goals"] == 1
         assert s["active_goals"] == 0
@@ -370,31 +432,33 @@ class TestGoalsSummary:
         assert s["total_target"] == 0
         assert s["top_goals"] == []
 
-    def test_summary_with_active_goals(self, goal_service):
+    def test_summary_with_active_goals(self, goal_service, monkeypatch):
         g1 = Goal(
             id=1,
             name="A",
-            target_amount=Decimal("100"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D100,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=0,
         )
         g2 = Goal(
             id=2,
             name="B",
-            target_amount=Decimal("200"),
-            initial_balance=Decimal("0"),
-            deadline=datetime.now(),
-            created_at=datetime.now(),
+            target_amount=D200,
+            initial_balance=D0,
+            deadline=NOW,
+            created_at=NOW,
             is_completed=0,
         )
-        goal_service.get_all_goals = MagicMock(return_value=[g1, g2])
+        monkeypatch.setattr(goal_service, "get_all_goals", Mock(return_value=[g1, g2]))
 
         # Mock progress results
         p1 = {"progress_amount": 30.0, "progress_pct": 30.0, "days_remaining": 10}
         p2 = {"progress_amount": 60.0, "progress_pct": 60.0, "days_remaining": 5}
-        goal_service.calculate_goal_progress = MagicMock(side_effect=[p1, p2])
+        monkeypatch.setattr(
+            goal_service, "calculate_goal_progress", Mock(side_effect=[p1, p2])
+        )
 
         s = goal_service.get_goals_summary()
         assert s["total_goals"] == 2
@@ -9,35 +9,44 @@ import pytest
 from app.database.models import Account, Category, Transaction, TransactionType
 from app.services.summary_service import SummaryService
 
+D0 = Decimal("0")
+D20 = Decimal("20")
+D80 = Decimal("80")
+D200 = Decimal("200")
+D1500 = Decimal("1500")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_db_session():
     return MagicMock()
 
 
-@pytest.fixture
+# SummaryService never calls these collaborators, so they are never reset
+@pytest.fixture(scope="session")
 def mock_account_service():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_category_service():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_currency_service():
     """Mock currency service for testing."""
     mock = MagicMock()
-    # Default: 1:1 conversion (all amounts treated as MYR)
-    mock.convert_to_myr = MagicMock(side_effect=lambda amount, currency: amount)
+    # Default: 1:1 conversion (all amounts treated as MYR); a plain function
+    # since no test asserts on its calls
+    mock.convert_to_myr = lambda amount, currency: amount
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def summary_service(
     mock_db_session, mock_account_service, mock_category_service, mock_currency_service
 ):
+    """One SummaryService shared by every test in this module."""
     return SummaryService(
         mock_db_session,
         mock_account_service,
@@ -46,11 +55,44 @@ def summary_service(
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_session(mock_db_session):
+    """Reset the shared session before each test, even summary_service-only ones."""
+    mock_db_session.reset_mock(return_value=True, side_effect=True)
+
+
+def _stub_rows(session, rows):
+    # One query stub answers .filter() however often it is chained, so the
+    # optional type filter in _get_transactions_in_range needs no extra setup
+    query = session.query.return_value
+    query.filter.return_value = query
+    query.all.return_value = rows
+
+
+@pytest.fixture
+def stub_rows(mock_db_session):
+    """Return a setter for the rows a query().filter()...all() chain yields."""
+    return lambda rows: _stub_rows(mock_db_session, rows)
+
+
+def _stub_totals(session, rows):
+    # Walk the grouped query chain through return_value so no calls get recorded
+    query = session.query.return_value.join.return_value.filter.return_value
+    query.group_by.return_value.order_by.return_value.all.return_value = rows
+
+
+@pytest.fixture
+def stub_totals(mock_db_session):
+    """Return a setter for the (category, total) rows of a grouped query."""
+    return lambda rows: _stub_totals(mock_db_session, rows)
+
+
 def create_transaction(amount, trans_type, category_name, date_time, currency="MYR"):
     """Helper function to create a transaction."""
-    account = Account(account_name="Test", balance=Decimal("0"))
+    account = Account(account_name="Test", balance=D0)
     category = Category(name=category_name, type=trans_type)
-    amount_decimal = Decimal(str(amount))
+    # Callers pass int literals, which Decimal takes exactly without a str() step
+    amount_decimal = amount if isinstance(amount, Decimal) else Decimal(amount)
     return Transaction(
         datetime=date_time,
         transaction_type=trans_type,
@@ -65,40 +107,38 @@ def create_transaction(amount, trans_type, category_name, date_time, currency="M
 
 class TestGetTransactionsInRange:
 
-    def test_get_transactions_success(self, summary_service, mock_db_session):
+    def test_get_transactions_success(self, summary_service, stub_rows):
         start = datetime(2025, 1, 1)
         end = datetime(2025, 1, 31)
         t1 = create_transaction(
             100, TransactionType.INCOME, "Salary", datetime(2025, 1, 15)
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1])
 
         result = summary_service._get_transactions_in_range(start, end)
         assert len(result) == 1
 
-    def test_get_transactions_with_type_filter(self, summary_service, mock_db_session):
+    def test_get_transactions_with_type_filter(
+        self, summary_service, stub_rows, mock_db_session
+    ):
         start = datetime(2025, 1, 1)
         end = datetime(2025, 1, 31)
         t1 = create_transaction(
             100, TransactionType.INCOME, "Salary", datetime(2025, 1, 15)
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().filter().all.return_value = [t1]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1])
 
         result = summary_service._get_transactions_in_range(
             start, end, TransactionType.INCOME
         )
         assert len(result) == 1
+        # Date range filter plus the transaction type filter
+        assert mock_db_session.query.return_value.filter.call_count == 2
 
-    def test_get_transactions_empty(self, summary_service, mock_db_session):
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_get_transactions_empty(self, summary_service, stub_rows):
+        stub_rows([])
 
         result = summary_service._get_transactions_in_range(
             datetime(2025, 1, 1), datetime(2025, 1, 31)
@@ -108,51 +148,45 @@ class TestGetTransactionsInRange:
 
 class TestGetDailySummary:
 
-    def test_daily_summary_mixed_transactions(self, summary_service, mock_db_session):
+    def test_daily_summary_mixed_transactions(self, summary_service, stub_rows):
         date = datetime(2025, 1, 15)
         t1 = create_transaction(100, TransactionType.INCOME, "Salary", date)
         t2 = create_transaction(30, TransactionType.EXPENSE, "Food", date)
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1, t2]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1, t2])
 
         result = summary_service.get_daily_summary(date)
 
         assert result["date"] == "15-01-2025"
-        assert result["total_income"] == Decimal("100")
-        assert result["total_expense"] == Decimal("30")
-        assert result["net"] == Decimal("70")
+        assert result["total_income"] == 100.0
+        assert result["total_expense"] == 30.0
+        assert result["net"] == 70.0
         assert result["transaction_count"] == 2
 
-    def test_daily_summary_only_income(self, summary_service, mock_db_session):
+    def test_daily_summary_only_income(self, summary_service, stub_rows):
         date = datetime(2025, 1, 15)
         t1 = create_transaction(100, TransactionType.INCOME, "Salary", date)
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1])
 
         result = summary_service.get_daily_summary(date)
-        assert result["total_income"] == Decimal("100")
-        assert result["total_expense"] == Decimal("0")
+        assert result["total_income"] == 100.0
+        assert result["total_expense"] == 0.0
 
-    def test_daily_summary_no_transactions(self, summary_service, mock_db_session):
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_daily_summary_no_transactions(self, summary_service, stub_rows):
+        stub_rows([])
 
         result = summary_service.get_daily_summary(datetime(2025, 1, 15))
 
-        assert result["total_income"] == Decimal("0")
-        assert result["total_expense"] == Decimal("0")
-        assert result["net"] == Decimal("0")
+        assert result["total_income"] == 0.0
+        assert result["total_expense"] == 0.0
+        assert result["net"] == 0.0
         assert result["transaction_count"] == 0
 
 
 class TestGetWeeklySummary:
 
-    def test_weekly_summary_success(self, summary_service, mock_db_session):
+    def test_weekly_summary_success(self, summary_service, stub_rows):
         date = datetime(2025, 1, 15)
         t1 = create_transaction(
             100, TransactionType.INCOME, "Salary", datetime(2025, 1, 13)
@@ -161,21 +195,17 @@ class TestGetWeeklySummary:
             30, TransactionType.EXPENSE, "Food", datetime(2025, 1, 15)
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1, t2]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1, t2])
 
         result = summary_service.get_weekly_summary(date)
 
-        assert result["total_income"] == Decimal("100")
-        assert result["total_expense"] == Decimal("30")
-        assert result["net"] == Decimal("70")
+        assert result["total_income"] == 100.0
+        assert result["total_expense"] == 30.0
+        assert result["net"] == 70.0
         assert result["transaction_count"] == 2
 
-    def test_weekly_summary_no_transactions(self, summary_service, mock_db_session):
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_weekly_summary_no_transactions(self, summary_service, stub_rows):
+        stub_rows([])
 
         result = summary_service.get_weekly_summary(datetime(2025, 1, 15))
         assert result["transaction_count"] == 0
@@ -183,7 +213,7 @@ class TestGetWeeklySummary:
 
 class TestGetMonthlySummary:
 
-    def test_monthly_summary_success(self, summary_service, mock_db_session):
+    def test_monthly_summary_success(self, summary_service, stub_rows):
         t1 = create_transaction(
             1000, TransactionType.INCOME, "Salary", datetime(2025, 1, 5)
         )
@@ -191,17 +221,15 @@ class TestGetMonthlySummary:
             200, TransactionType.EXPENSE, "Food", datetime(2025, 1, 15)
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1, t2]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1, t2])
 
         result = summary_service.get_monthly_summary(2025, 1)
 
         assert result["month"] == "January"
         assert result["year"] == 2025
-        assert result["total_income"] == Decimal("1000")
-        assert result["total_expense"] == Decimal("200")
-        assert result["net"] == Decimal("800")
+        assert result["total_income"] == 1000.0
+        assert result["total_expense"] == 200.0
+        assert result["net"] == 800.0
         assert result["transaction_count"] == 2
 
     def test_monthly_summary_invalid_month(self, summary_service):
@@ -212,108 +240,156 @@ class TestGetMonthlySummary:
         assert summary_service.get_monthly_summary(0, 1) == {}
         assert summary_service.get_monthly_summary(-1, 1) == {}
 
-    def test_monthly_summary_december(self, summary_service, mock_db_session):
+    def test_monthly_summary_december(self, summary_service, stub_rows):
         t1 = create_transaction(
             1000, TransactionType.INCOME, "Salary", datetime(2025, 12, 15)
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = [t1]
-        mock_db_session.query.return_value = mock_query
+        stub_rows([t1])
 
         result = summary_service.get_monthly_summary(2025, 12)
         assert result["month"] == "December"
 
-    def test_monthly_summary_no_transactions(self, summary_service, mock_db_session):
-        mock_query = MagicMock()
-        mock_query.filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_monthly_summary_no_transactions(self, summary_service, stub_rows):
+        stub_rows([])
 
         result = summary_service.get_monthly_summary(2025, 1)
         assert result["transaction_count"] == 0
 
 
-class TestGetExpensesByCategory:
+class TestGetTotalsByCategory:
 
-    def test_expenses_by_category_success(self, summary_service, mock_db_session):
-        start_date = datetime(2025, 1, 1)
-        end_date = datetime(2025, 1, 31)
+    def test_totals_by_category_success(self, summary_service, stub_totals):
+        stub_totals(
+            [
+                ("Food", D80),
+                ("Transport", D20),
+            ]
+        )
 
-        t1 = create_transaction(
-            50, TransactionType.EXPENSE, "Food", datetime(2025, 1, 5)
+        result = summary_service._get_totals_by_category(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), TransactionType.EXPENSE
         )
-        t2 = create_transaction(
-            30, TransactionType.EXPENSE, "Food", datetime(2025, 1, 15)
+        assert result == [("Food", D80), ("Transport", D20)]
+
+    def test_totals_by_category_empty(self, summary_service, stub_totals):
+        stub_totals([])
+
+        result = summary_service._get_totals_by_category(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), TransactionType.INCOME
         )
-        t3 = create_transaction(
-            20, TransactionType.EXPENSE, "Transport", datetime(2025, 1, 10)
+        assert result == []
+
+    def test_totals_by_category_against_database(
+        self,
+        db_session,
+        mock_account_service,
+        mock_category_service,
+        mock_currency_service,
+    ):
+        # Real rows, so the join, grouping, filters and ordering are all exercised
+        account = Account(account_name="Test", balance=D0)
+        food = Category(name="Food", type=TransactionType.EXPENSE)
+        transport = Category(name="Transport", type=TransactionType.EXPENSE)
+        salary = Category(name="Salary", type=TransactionType.INCOME)
+
+        def row(category, trans_type, amount, when):
+            return Transaction(
+                datetime=when,
+                transaction_type=trans_type,
+                amount=Decimal(amount),
+                currency="MYR",
+                amount_in_myr=Decimal(amount),
+                account=account,
+                category=category,
+            )
+
+        expense = TransactionType.EXPENSE
+        db_session.add_all(
+            [
+                row(food, expense, 30, datetime(2025, 1, 5)),
+                row(food, expense, 50, datetime(2025, 1, 20)),
+                row(transport, expense, 20, datetime(2025, 1, 10)),
+                # Outside the range: would put Transport first if counted
+                row(transport, expense, 500, datetime(2025, 2, 1)),
+                # Other type in range: must not appear among the expenses
+                row(salary, TransactionType.INCOME, 1500, datetime(2025, 1, 15)),
+            ]
+        )
+        db_session.flush()
+        service = SummaryService(
+            db_session,
+            mock_account_service,
+            mock_category_service,
+            mock_currency_service,
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().filter().all.return_value = [t1, t2, t3]
-        mock_db_session.query.return_value = mock_query
+        result = service._get_totals_by_category(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), TransactionType.EXPENSE
+        )
+        assert result == [("Food", D80), ("Transport", D20)]
+        assert all(isinstance(total, Decimal) for _, total in result)
+
+
+class TestGetExpensesByCategory:
+
+    def test_expenses_by_category_success(self, summary_service, stub_totals):
+        start_date = datetime(2025, 1, 1)
+        end_date = datetime(2025, 1, 31)
+
+        stub_totals(
+            [
+                ("Food", D80),
+                ("Transport", D20),
+            ]
+        )
 
         result = summary_service.get_expenses_by_category(start_date, end_date)
 
-        assert result["Food"] == Decimal("80")
-        assert result["Transport"] == Decimal("20")
+        assert result == [("Food", D80), ("Transport", D20)]
 
-    def test_expenses_by_category_no_transactions(
-        self, summary_service, mock_db_session
-    ):
-        mock_query = MagicMock()
-        mock_query.filter().filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_expenses_by_category_no_transactions(self, summary_service, stub_totals):
+        stub_totals([])
 
         result = summary_service.get_expenses_by_category(
             datetime(2025, 1, 1), datetime(2025, 1, 31)
         )
-        assert result == {}
+        assert result == []
 
     def test_expenses_by_category_start_after_end(self, summary_service):
         result = summary_service.get_expenses_by_category(
             datetime(2025, 1, 31), datetime(2025, 1, 1)
         )
-        assert result == {}
+        assert result == []
 
 
 class TestGetIncomeByCategory:
 
-    def test_income_by_category_success(self, summary_service, mock_db_session):
+    def test_income_by_category_success(self, summary_service, stub_totals):
         start_date = datetime(2025, 1, 1)
         end_date = datetime(2025, 1, 31)
 
-        t1 = create_transaction(
-            1000, TransactionType.INCOME, "Salary", datetime(2025, 1, 5)
-        )
-        t2 = create_transaction(
-            500, TransactionType.INCOME, "Salary", datetime(2025, 1, 15)
-        )
-        t3 = create_transaction(
-            200, TransactionType.INCOME, "Freelance", datetime(2025, 1, 10)
+        stub_totals(
+            [
+                ("Salary", D1500),
+                ("Freelance", D200),
+            ]
         )
 
-        mock_query = MagicMock()
-        mock_query.filter().filter().all.return_value = [t1, t2, t3]
-        mock_db_session.query.return_value = mock_query
-
         result = summary_service.get_income_by_category(start_date, end_date)
 
-        assert result["Salary"] == Decimal("1500")
-        assert result["Freelance"] == Decimal("200")
+        assert result == [("Salary", D1500), ("Freelance", D200)]
 
-    def test_income_by_category_no_transactions(self, summary_service, mock_db_session):
-        mock_query = MagicMock()
-        mock_query.filter().filter().all.return_value = []
-        mock_db_session.query.return_value = mock_query
+    def test_income_by_category_no_transactions(self, summary_service, stub_totals):
+        stub_totals([])
 
         result = summary_service.get_income_by_category(
             datetime(2025, 1, 1), datetime(2025, 1, 31)
         )
-        assert result == {}
+        assert result == []
 
     def test_income_by_category_start_after_end(self, summary_service):
         result = summary_service.get_income_by_category(
             datetime(2025, 1, 31), datetime(2025, 1, 1)
         )
-        assert result == {}
+        assert result == []
@@ -2,42 +2,83 @@
 
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import MagicMock
+from functools import cache
+from unittest.mock import Mock, call
 
 import pytest
+from sqlalchemy.orm import Session
 
 from app.database.models import Account, Category, Transaction, TransactionType
 from app.exception import InvalidInputError, NotFoundError
+from app.services.account_service import AccountService
+from app.services.category_service import CategoryService
+from app.services.currency_service import CurrencyService
 from app.services.transaction_service import TransactionService
 
+D1 = Decimal("1.0")
+D30 = Decimal("30")
+D50 = Decimal("50")
+D100 = Decimal("100")
+D1000 = Decimal("1000")
 
-@pytest.fixture
+# Fixed timestamp for built transactions, instead of a clock read per case
+_FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
 def mock_db_session():
-    return MagicMock()
+    return Mock(spec=Session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_account_service():
-    return MagicMock()
+    return Mock(spec=AccountService)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_category_service():
-    return MagicMock()
+    return Mock(spec=CategoryService)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_currency_service():
-    service = MagicMock()
-    service.convert_to_myr.side_effect = lambda amount, currency: amount
-    service.get_exchange_rate.return_value = Decimal("1.0")  # Default to 1.0 for MYR
-    return service
+    return Mock(spec=CurrencyService)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_db_session, mock_account_service, mock_category_service, mock_currency_service
+):
+    """Clear the shared mocks' stubs and calls, then restore the MYR rate."""
+    for mock in (
+        mock_db_session,
+        mock_account_service,
+        mock_category_service,
+        mock_currency_service,
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+    # TransactionService converts through get_exchange_rate and never calls
+    # convert_to_myr, so only the rate needs a default: 1.0 for MYR
+    mock_currency_service.get_exchange_rate.return_value = D1
+
+
+@pytest.fixture(scope="session")
+def _usd_rate():
+    return Decimal("4.50")
 
 
 @pytest.fixture
+def usd_rate(mock_currency_service, _usd_rate):
+    """Quote 1 USD = 4.50 MYR; the next _reset_mocks restores the MYR rate."""
+    mock_currency_service.get_exchange_rate.return_value = _usd_rate
+    return _usd_rate
+
+
+@pytest.fixture(scope="module")
 def transaction_service(
     mock_db_session, mock_account_service, mock_category_service, mock_currency_service
 ):
+    """One TransactionService over the shared mocks; _reset_mocks keeps tests apart."""
     return TransactionService(
         mock_db_session,
         mock_account_service,
@@ -46,36 +87,137 @@ def transaction_service(
     )
 
 
+class _QueryStub:
+    """Plain query stand-in returning fixed results, without mock call recording."""
+
+    def __init__(self, first=None, rows=()):
+        self._first = first
+        self._rows = list(rows)
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def options(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def first(self):
+        return self._first
+
+    def all(self):
+        return self._rows
+
+
+def _committed_once(session, obj, method="add"):
+    """Assert one add (or delete) of obj and one commit, reading the calls once."""
+    calls = session.method_calls
+    names = [c[0] for c in calls]
+    assert names.count(method) == 1 and names.count("commit") == 1
+    assert calls[names.index(method)].args[0] is obj
+
+
+def make_account(name="Main", balance=D100, id=None):
+    """Build an unsessioned Account for the service to read and update."""
+    return Account(account_name=name, balance=balance, id=id)
+
+
+def make_category(name, type=TransactionType.EXPENSE, id=None):
+    """Build an unsessioned Category for the service to link."""
+    return Category(name=name, type=type, id=id)
+
+
+@cache
+def _cat(name, ttype):
+    """Shared Category for tests that fail before it is linked to a transaction."""
+    # Linking appends to category.transactions through back_populates, so a
+    # cached category must never reach a successful add or edit
+    return make_category(name, ttype)
+
+
+@pytest.fixture(scope="module")
+def _account_template(request):
+    """Account column values, unpacked once per (name, balance) parameter."""
+    name, balance = request.param
+    return dict(account_name=name, balance=balance)
+
+
+@pytest.fixture
+def prepared_account(_account_template):
+    """Fresh account from the parametrized values, so balance changes stay per test."""
+    return Account(**_account_template, id=1)
+
+
+@pytest.fixture(scope="module")
+def _txn_template(request):
+    """Transaction column values per (type, amount, currency, MYR amount) parameter."""
+    trans_type, amount, currency, amount_myr = request.param
+    return dict(
+        transaction_type=trans_type,
+        amount=amount,
+        currency=currency,
+        amount_in_myr=amount_myr,
+        exchange_rate=amount_myr / amount,
+    )
+
+
+@pytest.fixture
+def prepared_transaction(_txn_template):
+    return Transaction(**_txn_template, id=1)
+
+
+@pytest.fixture(scope="session")
+def _stored_txn_template():
+    """Column values of a stored MYR expense; tests edit instances built from it."""
+    return dict(
+        id=1,
+        datetime=_FIXED_DT,
+        transaction_type=TransactionType.EXPENSE,
+        amount=D50,
+        currency="MYR",
+        amount_in_myr=D50,
+        exchange_rate=D1,
+        description="Test",
+    )
+
+
+@pytest.fixture
+def existing_transaction(_stored_txn_template):
+    """Fresh stored expense, so edits stay per test."""
+    return Transaction(**_stored_txn_template)
+
+
 class TestAddTransaction:
 
     @pytest.mark.parametrize(
-        "trans_type,cat_name,cat_type,acc_name,initial_bal,amount,desc,currency,myr_equiv,expected_bal",
+        "trans_type,cat_name,cat_type,_account_template,amount,desc,currency,myr_equiv,expected_bal",
         [
             (
                 "income",
                 "Salary",
                 TransactionType.INCOME,
-                "Main",
-                "100",
+                ("Main", D100),
                 "50.25",
                 " October salary ",
                 None,
-                "50.25",
-                "150.25",
+                Decimal("50.25"),
+                Decimal("150.25"),
             ),
             (
                 "expense",
                 "Groceries",
                 TransactionType.EXPENSE,
-                "Wallet",
-                "200",
+                ("Wallet", Decimal("200")),
                 "30.50",
                 "",
                 None,
-                "30.50",
-                "169.50",
+                Decimal("30.50"),
+                Decimal("169.50"),
             ),
         ],
+        ids=["income_salary_myr", "expense_groceries_myr"],
+        indirect=["_account_template"],
     )
     def test_add_transaction_success(
         self,
@@ -83,21 +225,19 @@ class TestAddTransaction:
         mock_db_session,
         mock_account_service,
         mock_category_service,
+        prepared_account,
         trans_type,
         cat_name,
         cat_type,
-        acc_name,
-        initial_bal,
         amount,
         desc,
         currency,
         myr_equiv,
         expected_bal,
     ):
-        account = Account(account_name=acc_name, balance=Decimal(initial_bal))
-        account.id = 1
-        category = Category(name=cat_name, type=cat_type)
-        category.id = 1
+        account = prepared_account
+        acc_name = account.account_name
+        category = make_category(cat_name, cat_type, id=1)
         mock_account_service.get_account.return_value = account
         mock_category_service.get_category_by_name_and_type.return_value = category
 
@@ -111,12 +251,13 @@ class TestAddTransaction:
                 trans_type, cat_name, acc_name, amount, desc
             )
 
-        assert transaction.amount == Decimal(amount)
+        # MYR amounts need no conversion, so both match the MYR equivalent
+        assert transaction.amount == myr_equiv
+        assert transaction.amount_in_myr == myr_equiv
         assert transaction.transaction_type == cat_type
         assert transaction.description == desc.strip()
-        assert account.balance == Decimal(expected_bal)
-        mock_db_session.add.assert_called_once_with(transaction)
-        mock_db_session.commit.assert_called_once()
+        assert account.balance == expected_bal
+        _committed_once(mock_db_session, transaction)
 
     def test_add_transaction_with_foreign_currency(
         self,
@@ -125,19 +266,15 @@ class TestAddTransaction:
         mock_account_service,
         mock_category_service,
         mock_currency_service,
+        usd_rate,
     ):
         """Test adding transaction in foreign currency (USD) converts to MYR for balance."""
-        account = Account(account_name="Main", balance=Decimal("1000"))
-        account.id = 1
-        category = Category(name="Shopping", type=TransactionType.EXPENSE)
-        category.id = 1
+        account = make_account("Main", D1000, id=1)
+        category = make_category("Shopping", TransactionType.EXPENSE, id=1)
 
         mock_account_service.get_account.return_value = account
         mock_category_service.get_category_by_name_and_type.return_value = category
 
-        # Mock USD to MYR exchange rate: 1 USD = 4.50 MYR
-        mock_currency_service.get_exchange_rate.return_value = Decimal("4.50")
-
         transaction = transaction_service.add_transaction(
             transaction_type_input="expense",
             category_name="Shopping",
@@ -147,26 +284,23 @@ class TestAddTransaction:
             currency="USD",
         )
 
-        assert transaction.amount == Decimal("100.00")
+        assert transaction.amount == D100
         assert transaction.currency == "USD"
         assert transaction.transaction_type == TransactionType.EXPENSE
-        assert transaction.exchange_rate == Decimal("4.50")
+        assert transaction.exchange_rate == usd_rate
         assert transaction.amount_in_myr == Decimal("450.00")
 
         # Balance should decrease by MYR equivalent (RM 450)
         assert account.balance == Decimal("550.00")  # 1000 - 450
 
         # Verify get_exchange_rate was called (not convert_to_myr)
-        mock_currency_service.get_exchange_rate.assert_called_once_with("USD")
-        mock_db_session.add.assert_called_once_with(transaction)
-        mock_db_session.commit.assert_called_once()
+        assert mock_currency_service.get_exchange_rate.call_args_list == [call("USD")]
+        _committed_once(mock_db_session, transaction)
 
     def test_add_transaction_category_not_exist_raises(
         self, transaction_service, mock_account_service, mock_category_service
     ):
-        mock_account_service.get_account.return_value = Account(
-            account_name="Main", balance=Decimal("100")
-        )
+        mock_account_service.get_account.return_value = make_account()
         mock_category_service.get_category_by_name_and_type.return_value = None
         with pytest.raises(NotFoundError):
             transaction_service.add_transaction(
@@ -176,8 +310,8 @@ class TestAddTransaction:
     def test_add_transaction_account_not_exist_raises(
         self, transaction_service, mock_account_service, mock_category_service
     ):
-        mock_category_service.get_category_by_name_and_type.return_value = Category(
-            name="Salary", type=TransactionType.INCOME
+        mock_category_service.get_category_by_name_and_type.return_value = _cat(
+            "Salary", TransactionType.INCOME
         )
         mock_account_service.get_account.return_value = None
         with pytest.raises(NotFoundError):
@@ -202,8 +336,15 @@ class TestAddTransaction:
                 InvalidInputError,
             ),
         ],
+        ids=[
+            "invalid_type",
+            "negative_amount",
+            "empty_category",
+            "empty_account",
+            "unsupported_currency",
+        ],
     )
-    def test_add_transaction_validation_errors(
+    def test_add_transaction_validation_fails_fast(
         self,
         transaction_service,
         mock_account_service,
@@ -216,15 +357,7 @@ class TestAddTransaction:
         error_match,
         error_type,
     ):
-        if account:
-            mock_account_service.get_account.return_value = Account(
-                account_name="Main", balance=Decimal("100")
-            )
-        if category:
-            mock_category_service.get_category_by_name_and_type.return_value = Category(
-                name="Food", type=TransactionType.EXPENSE
-            )
-
+        # Input validation runs before either lookup, so nothing is stubbed
         with pytest.raises(error_type, match=error_match):
             if currency:
                 transaction_service.add_transaction(
@@ -234,46 +367,48 @@ class TestAddTransaction:
                 transaction_service.add_transaction(
                     trans_type, category, account, amount, "Test"
                 )
+        mock_category_service.get_category_by_name_and_type.assert_not_called()
+        mock_account_service.get_account.assert_not_called()
 
 
 class TestGetTransaction:
 
     def test_get_existing_transaction(self, transaction_service, mock_db_session):
         transaction = Transaction()
-        mock_db_session.query().filter_by().first.return_value = transaction
+        mock_db_session.query.return_value = _QueryStub(first=transaction)
         result = transaction_service.get_transaction(1)
         assert result == transaction
 
     def test_get_non_existing_transaction_returns_none(
         self, transaction_service, mock_db_session
     ):
-        mock_db_session.query().filter_by().first.return_value = None
+        mock_db_session.query.return_value = _QueryStub(first=None)
         result = transaction_service.get_transaction(999)
         assert result is None
 
 
-class TestGetAllTransactions:
+# Read-only rows shared by the get-all cases, which only compare identity
+_T1 = Transaction(id=1)
+_T2 = Transaction(id=2)
 
-    def test_get_all_transactions_descending(
-        self, transaction_service, mock_db_session
-    ):
-        t1 = Transaction()
-        t2 = Transaction()
-        mock_db_session.query().order_by().all.return_value = [t2, t1]
-        result = transaction_service.get_all_transactions()
-        assert result == [t2, t1]
 
-    def test_get_all_transactions_ascending(self, transaction_service, mock_db_session):
-        t1 = Transaction()
-        t2 = Transaction()
-        mock_db_session.query().order_by().all.return_value = [t1, t2]
-        result = transaction_service.get_all_transactions(reverse_chronological=False)
-        assert result == [t1, t2]
+class TestGetAllTransactions:
 
-    def test_get_all_transactions_empty(self, transaction_service, mock_db_session):
-        mock_db_session.query().order_by().all.return_value = []
-        result = transaction_service.get_all_transactions()
-        assert result == []
+    @pytest.mark.parametrize(
+        "rows,kwargs,expected",
+        [
+            ([_T2, _T1], {}, [_T2, _T1]),
+            ([_T1, _T2], {"reverse_chronological": False}, [_T1, _T2]),
+            ([], {}, []),
+        ],
+        ids=["desc", "asc", "empty"],
+    )
+    def test_get_all_transactions(
+        self, transaction_service, mock_db_session, rows, kwargs, expected
+    ):
+        mock_db_session.query.return_value = _QueryStub(rows=rows)
+        result = transaction_service.get_all_transactions(**kwargs)
+        assert result == expected
 
 
 class TestEditTransaction:
@@ -281,87 +416,79 @@ class TestEditTransaction:
     def test_edit_transaction_update_all_fields(
         self,
         transaction_service,
+        monkeypatch,
         mock_db_session,
         mock_account_service,
         mock_category_service,
-        mock_currency_service,
+        existing_transaction,
     ):
-        old_account = Account(account_name="Wallet", balance=Decimal("200"))
-        new_account = Account(account_name="Bank", balance=Decimal("500"))
-        old_account.id = new_account.id = 1
-        old_cat = Category(name="Groceries", type=TransactionType.EXPENSE)
-        new_cat = Category(name="Bills", type=TransactionType.EXPENSE)
-        transaction = Transaction(
-            datetime=datetime.now(),
-            transaction_type=TransactionType.EXPENSE,
-            amount=Decimal("50"),
-            currency="MYR",
-            amount_in_myr=Decimal("50"),
-            exchange_rate=Decimal("1.0"),
-            account=old_account,
-            category=old_cat,
-            description="Old",
+        old_account = make_account("Wallet", Decimal("200"), id=1)
+        new_account = make_account("Bank", Decimal("500"), id=1)
+        old_cat = make_category("Groceries", TransactionType.EXPENSE)
+        new_cat = make_category("Bills", TransactionType.EXPENSE)
+        transaction = existing_transaction
+        transaction.account = old_account
+        transaction.category = old_cat
+
+        monkeypatch.setattr(
+            transaction_service, "get_transaction", Mock(return_value=transaction)
         )
-        transaction.id = 1
-
-        transaction_service.get_transaction = MagicMock(return_value=transaction)
         mock_account_service.get_account.return_value = new_account
         mock_category_service.get_category_by_name_and_type.return_value = new_cat
-        mock_currency_service.convert_to_myr.side_effect = (
-            lambda amount, currency: amount
-        )
 
         updated = transaction_service.edit_transaction(
             1, "expense", "Bills", "Bank", "30", "Updated"
         )
 
-        assert updated.amount == Decimal("30")
+        assert updated.amount == D30
         assert updated.description == "Updated"
         assert updated.account == new_account
         assert updated.category == new_cat
         assert old_account.balance == Decimal("250")
         assert new_account.balance == Decimal("470")
-        mock_db_session.commit.assert_called_once()
+        assert mock_db_session.commit.call_count == 1
+
+    def test_edit_transaction_not_found(self, transaction_service, monkeypatch):
+        monkeypatch.setattr(
+            transaction_service, "get_transaction", Mock(return_value=None)
+        )
+        with pytest.raises(NotFoundError, match="Transaction ID 999 not found"):
+            transaction_service.edit_transaction(999, "", "", "", "100", "")
 
     @pytest.mark.parametrize(
-        "error_type,trans_id,type_input,cat,acc,amt,match",
+        "error_type,type_input,cat,acc,amt,match",
         [
-            (NotFoundError, 999, "", "", "", "100", "Transaction ID 999 not found"),
-            (NotFoundError, 1, "expense", "Bad", "", "", "Category 'Bad' not found"),
-            (NotFoundError, 1, "", "", "Bad", "", "Account 'Bad' not found"),
-            (InvalidInputError, 1, "bad_type", "", "", "", None),
-            (InvalidInputError, 1, "", "", "", "-100", None),
+            (NotFoundError, "expense", "Bad", "", "", "Category 'Bad' not found"),
+            (NotFoundError, "", "", "Bad", "", "Account 'Bad' not found"),
+            (InvalidInputError, "bad_type", "", "", "", None),
+            (InvalidInputError, "", "", "", "-100", None),
+        ],
+        ids=[
+            "category_not_exist",
+            "account_not_exist",
+            "invalid_type",
+            "negative_amount",
         ],
     )
-    def test_edit_transaction_errors(
+    def test_edit_transaction_validation_errors(
         self,
         transaction_service,
+        monkeypatch,
         mock_account_service,
         mock_category_service,
+        existing_transaction,
         error_type,
-        trans_id,
         type_input,
         cat,
         acc,
         amt,
         match,
     ):
-        if trans_id == 1:
-            trans = Transaction(
-                datetime=datetime.now(),
-                transaction_type=TransactionType.EXPENSE,
-                amount=Decimal("50"),
-                currency="MYR",
-                amount_in_myr=Decimal("50"),
-                exchange_rate=Decimal("1.0"),
-                account=Account(account_name="Main", balance=Decimal("100")),
-                category=Category(name="Food", type=TransactionType.EXPENSE),
-                description="Test",
-            )
-            trans.id = 1
-            transaction_service.get_transaction = MagicMock(return_value=trans)
-        else:
-            transaction_service.get_transaction = MagicMock(return_value=None)
+        monkeypatch.setattr(
+            transaction_service,
+            "get_transaction",
+            Mock(return_value=existing_transaction),
+        )
 
         if cat == "Bad":
             mock_category_service.get_category_by_name_and_type.return_value = None
@@ -369,57 +496,65 @@ class TestEditTransaction:
             mock_account_service.get_account.return_value = None
 
         with pytest.raises(error_type, match=match):
-            transaction_service.edit_transaction(
-                trans_id, type_input, cat, acc, amt, ""
-            )
+            transaction_service.edit_transaction(1, type_input, cat, acc, amt, "")
 
 
 class TestDeleteTransaction:
 
     @pytest.mark.parametrize(
-        "trans_type,amount,currency,amount_myr,initial_balance,expected_balance,should_convert",
+        "_txn_template,_account_template,expected_balance,should_convert",
         [
-            (TransactionType.INCOME, "50", "MYR", "50", "100", "50", False),
-            (TransactionType.EXPENSE, "30", "MYR", "30", "100", "130", False),
-            (TransactionType.EXPENSE, "100", "USD", "450", "1000", "1450", False),
+            ((TransactionType.INCOME, D50, "MYR", D50), ("Main", D100), D50, False),
+            (
+                (TransactionType.EXPENSE, D30, "MYR", D30),
+                ("Main", D100),
+                Decimal("130"),
+                False,
+            ),
+            (
+                (TransactionType.EXPENSE, D100, "USD", Decimal("450")),
+                ("Main", D1000),
+                Decimal("1450"),
+                False,
+            ),
         ],
+        ids=["income_myr", "expense_myr", "expense_usd"],
+        indirect=["_txn_template", "_account_template"],
     )
     def test_delete_transaction(
         self,
         transaction_service,
+        monkeypatch,
         mock_db_session,
         mock_currency_service,
-        trans_type,
-        amount,
-        currency,
-        amount_myr,
-        initial_balance,
+        prepared_transaction,
+        prepared_account,
         expected_balance,
         should_convert,
     ):
-        account = Account(account_name="Main", balance=Decimal(initial_balance))
-        transaction = Transaction(
-            transaction_type=trans_type,
-            amount=Decimal(amount),
-            currency=currency,
-            amount_in_myr=Decimal(amount_myr),
-            exchange_rate=Decimal(amount_myr) / Decimal(amount),
-            account=account,
+        account = prepared_account
+        transaction = prepared_transaction
+        transaction.account = account
+        monkeypatch.setattr(
+            transaction_service, "get_transaction", Mock(return_value=transaction)
         )
-        transaction.id = 1
-        transaction_service.get_transaction = MagicMock(return_value=transaction)
         if should_convert:
-            mock_currency_service.convert_to_myr.return_value = Decimal(amount_myr)
+            mock_currency_service.convert_to_myr.return_value = (
+                transaction.amount_in_myr
+            )
 
         result = transaction_service.delete_transaction(1)
         assert result is True
-        assert account.balance == Decimal(expected_balance)
+        assert account.balance == expected_balance
         if not should_convert:
-            mock_currency_service.convert_to_myr.assert_not_called()
-        mock_db_session.delete.assert_called_once_with(transaction)
-        mock_db_session.commit.assert_called_once()
+            assert mock_currency_service.convert_to_myr.call_count == 0
+        _committed_once(mock_db_session, transaction, method="delete")
 
-    def test_delete_non_existing_transaction_raises(self, transaction_service):
-        transaction_service.get_transaction = MagicMock(return_value=None)
+    def test_delete_non_existing_transaction_raises(
+        self, transaction_service, monkeypatch
+    ):
+        monkeypatch.setattr(
+            transaction_service, "get_transaction", Mock(return_value=None)
+        )
         with pytest.raises(NotFoundError):
             transaction_service.delete_transaction(999)